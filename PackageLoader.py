@@ -2,7 +2,14 @@
 import sys
 import subprocess
 import re
+import bisect
+import shlex
+import shutil
 import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter
 
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
@@ -13,6 +20,321 @@ g_FONT_SIZE = 10
 g_FONT_10_normal_ref = QFont(g_FONT_FACE, g_FONT_SIZE)
 g_FONT_10_bold_ref = QFont(g_FONT_FACE, g_FONT_SIZE, QFont.Bold)
 
+# 패키지 테이블 색상 (셀을 그릴 때마다 새로 만들지 않도록 한 번만 생성)
+g_COLOR_TEXT_normal_ref = QColor('black')
+g_COLOR_TEXT_system_ref = QColor('gray')  # 시스템 앱
+g_COLOR_BG_normal_ref = QColor(255, 255, 255)  # 흰색 배경
+g_COLOR_BG_highlight_ref = QColor(255, 255, 224)  # 검색 결과 (연한 노란색)
+
+# Windows 에서 adb 실행 시 콘솔 창이 뜨지 않도록 설정
+_NO_WINDOW = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
+
+# 다이얼로그의 adb 조회를 처리하는 공용 스레드 풀
+_ADB_POOL = QThreadPool()
+_ADB_POOL.setMaxThreadCount(4)
+
+
+class AdbTask(QRunnable):
+    """스레드 풀에서 함수 하나를 실행하는 작업 (이벤트 루프가 없는 가벼운 작업 단위)"""
+
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+
+    def run(self):
+        self.func()
+
+
+class TTLCache:
+    """만료 시간과 최대 크기가 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, maxsize=256, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """만료되지 않은 값 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """값 저장 (가장 오래 사용하지 않은 항목부터 밀어냄)"""
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def pop(self, key):
+        """항목 제거"""
+        with self._lock:
+            self._items.pop(key, None)
+
+
+# (device_id, package_name) -> dumpsys package 원본 출력 / 파싱된 상세 정보
+# (원본 출력은 패키지마다 수십 KB 이므로 작게 유지)
+_DUMPSYS_CACHE = TTLCache(maxsize=128)
+_DETAIL_CACHE = TTLCache(maxsize=4096)
+
+
+def invalidate_package_cache(device_id, package_names):
+    """패키지 상태가 바뀌었을 때 캐시된 dumpsys 결과 제거"""
+    for package_name in package_names:
+        key = (device_id, package_name)
+        _DUMPSYS_CACHE.pop(key)
+        _DETAIL_CACHE.pop(key)
+
+
+# device_id -> adb get-state 결과 (짧은 시간 안의 반복 확인을 합침)
+_DEVICE_STATE_CACHE = TTLCache(maxsize=16, ttl=2)
+
+# device_id -> 이름순 (패키지 이름, 시스템 앱 여부) 튜플 (같은 디바이스를 다시 열 때 pm list 생략)
+_PACKAGE_LIST_CACHE = TTLCache(maxsize=16, ttl=60)
+
+
+def is_device_online(device_id):
+    """adb get-state 로 디바이스 연결 여부를 빠르게 확인"""
+    online = _DEVICE_STATE_CACHE.get(device_id)
+    if online is None:
+        try:
+            result = subprocess.run(["adb", "-s", device_id, "get-state"],
+                                    capture_output=True, text=True, timeout=2,
+                                    creationflags=_NO_WINDOW)
+            online = result.returncode == 0 and result.stdout.strip() == "device"
+        except (subprocess.SubprocessError, OSError):
+            online = False
+        _DEVICE_STATE_CACHE.put(device_id, online)
+    return online
+
+
+# adb devices 로 읽은 온라인 디바이스 목록 (F5 를 연달아 눌러도 adb 는 한 번만 실행)
+_DEVICE_LIST_CACHE = TTLCache(maxsize=1, ttl=2)
+# adb devices 출력의 "<id>\t<상태>" 줄 (첫 줄 "List of devices attached" 는 탭이 없어 제외)
+_DEVICE_LINE_RE = re.compile(r'^(\S+)\t(\S+)', re.M)
+
+
+def list_online_devices():
+    """adb devices 로 연결된 디바이스 ID 목록 반환 (목록에 나온 상태로 연결 여부 캐시도 채움)"""
+    devices = _DEVICE_LIST_CACHE.get('devices')
+    if devices is None:
+        result = subprocess.run(["adb", "devices"], capture_output=True, text=True,
+                                timeout=10, creationflags=_NO_WINDOW)
+        devices = []
+        for device_id, state in _DEVICE_LINE_RE.findall(result.stdout):
+            online = state == 'device'
+            _DEVICE_STATE_CACHE.put(device_id, online)
+            if online:
+                devices.append(device_id)
+        # 시리얼은 대소문자가 섞여 있으므로 대소문자 구분 없이 정렬
+        devices = tuple(sorted(devices, key=str.lower))
+        _DEVICE_LIST_CACHE.put('devices', devices)
+    return devices
+
+
+@lru_cache(maxsize=32)
+def compile_search_pattern(search_text):
+    """검색어를 대소문자 무시 정규표현식으로 컴파일 (최근 검색어는 재사용)"""
+    return re.compile(search_text, re.IGNORECASE)
+
+
+class AdbShell:
+    """디바이스별로 재사용하는 영구 adb shell 세션 (명령마다 adb 프로세스를 띄우지 않음)"""
+    SENTINEL = "__ADBEOF__"
+
+    _sessions = {}
+    _sessions_lock = threading.Lock()
+    # 프로그램 종료 중이면 새 세션을 만들지 않음 (close_all 이 설정)
+    _shutting_down = False
+
+    def __init__(self, device_id):
+        self.device_id = device_id
+        self.process = None
+        self.lock = threading.Lock()
+        # 프로그램 종료로 닫힌 세션은 다시 연결하지 않음
+        self.closed = False
+        # 명령마다 타이머 스레드를 만들지 않고 세션당 감시 스레드 하나가 마감 시간을 확인
+        self._watch_cond = threading.Condition()
+        self._watch_thread = None
+        self._watch_process = None
+        self._deadline = None
+        self._expired = False
+
+    @classmethod
+    def get(cls, device_id):
+        """디바이스의 세션 반환 (없으면 생성, 종료 중이면 OSError)"""
+        with cls._sessions_lock:
+            if cls._shutting_down:
+                raise OSError(f"프로그램 종료 중이라 adb shell 세션을 열 수 없습니다: {device_id}")
+            session = cls._sessions.get(device_id)
+            if session is None:
+                session = cls(device_id)
+                cls._sessions[device_id] = session
+            return session
+
+    @classmethod
+    def close_all(cls):
+        """열려 있는 모든 세션 종료 (이후에는 새 세션도 만들지 않음)"""
+        with cls._sessions_lock:
+            cls._shutting_down = True
+            sessions = list(cls._sessions.values())
+            cls._sessions.clear()
+        for session in sessions:
+            session.closed = True
+            # 다른 스레드가 출력을 기다리는 중이면 프로세스를 먼저 종료해 바로 풀려나게 함
+            process = session.process
+            if process is not None:
+                try:
+                    process.kill()
+                except OSError:
+                    pass
+            with session.lock:
+                session._close_process()
+
+    def _start_process(self):
+        self.process = subprocess.Popen(["adb", "-s", self.device_id, "shell"],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True,
+                                        encoding='utf-8', errors='replace',
+                                        creationflags=_NO_WINDOW)
+
+    def _close_process(self):
+        process, self.process = self.process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        if process.poll() is None:
+            process.kill()
+        process.wait()
+
+    def _arm_timeout(self, process, timeout):
+        """process 가 timeout 초 안에 끝나지 않으면 종료하도록 감시 시작"""
+        with self._watch_cond:
+            self._watch_process = process
+            self._deadline = time.monotonic() + timeout
+            self._expired = False
+            if self._watch_thread is None:
+                self._watch_thread = threading.Thread(target=self._watch, daemon=True)
+                self._watch_thread.start()
+            self._watch_cond.notify()
+
+    def _disarm_timeout(self):
+        """감시 중지 후 타임아웃으로 종료되었는지 반환"""
+        with self._watch_cond:
+            self._deadline = None
+            self._watch_process = None
+            self._watch_cond.notify()
+            return self._expired
+
+    def _watch(self):
+        with self._watch_cond:
+            while True:
+                if self._deadline is None:
+                    self._watch_cond.wait()
+                    continue
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0:
+                    self._watch_cond.wait(remaining)
+                    continue
+                self._deadline = None
+                self._expired = True
+                self._watch_process.kill()
+
+    def _send(self, command):
+        if self.closed:
+            raise OSError(f"adb shell 세션이 종료되었습니다: {self.device_id}")
+        if self.process is None or self.process.poll() is not None:
+            self._close_process()
+            self._start_process()
+        self.process.stdin.write(f"{command}; echo {self.SENTINEL}$?\n")
+        self.process.stdin.flush()
+
+    def _read_until_sentinel(self, process):
+        """센티널까지 출력 줄을 yield 하고 종료 코드 반환 (세션이 끊기면 None)"""
+        while True:
+            line = process.stdout.readline()
+            if not line:
+                return None
+            pos = line.find(self.SENTINEL)
+            if pos >= 0:
+                if pos > 0:
+                    yield line[:pos]
+                return int(line[pos + len(self.SENTINEL):].strip() or 1)
+            yield line
+
+    def _drain(self, process):
+        """남은 출력을 센티널까지 버리고 종료 코드 반환"""
+        reader = self._read_until_sentinel(process)
+        try:
+            while True:
+                next(reader)
+        except StopIteration as stop:
+            return stop.value
+
+    def stream(self, command, timeout=30):
+        """셸 명령 출력을 한 줄씩 yield (실패 시 마지막에 CalledProcessError, 중간에 멈추면 나머지는 버림)"""
+        with self.lock:
+            try:
+                self._send(command)
+            except OSError:
+                # 세션이 끊어졌으면 한 번 다시 연결
+                self._close_process()
+                self._send(command)
+
+            process = self.process
+            self._arm_timeout(process, timeout)
+            returncode = None
+            finished = False
+            try:
+                returncode = yield from self._read_until_sentinel(process)
+                finished = True
+            finally:
+                if not finished:
+                    # 호출자가 중간에 멈췄으면 남은 출력을 버려 세션을 다음 명령에 맞춰 둠
+                    returncode = self._drain(process)
+                expired = self._disarm_timeout()
+                if returncode is None:
+                    # 타임아웃 또는 디바이스 연결 끊김으로 세션 종료
+                    self._close_process()
+
+            if returncode is None and expired:
+                raise subprocess.TimeoutExpired(command, timeout)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(1 if returncode is None else returncode, command)
+
+    def run(self, command, timeout=30):
+        """셸 명령 실행 후 CompletedProcess 반환 (stderr는 stdout에 합쳐지며 실패 시 stderr에도 담김)"""
+        lines = []
+        try:
+            for line in self.stream(command, timeout):
+                lines.append(line)
+        except subprocess.CalledProcessError as e:
+            output = ''.join(lines)
+            return subprocess.CompletedProcess(command, e.returncode, output, output)
+        return subprocess.CompletedProcess(command, 0, ''.join(lines), '')
+
+
+class PackageRow:
+    """패키지 한 줄의 데이터 (이름, 시스템 앱 여부, 체크 상태)"""
+    __slots__ = ('name', 'is_system', 'selected')
+
+    def __init__(self, name, is_system=False, selected=False):
+        self.name = name
+        self.is_system = is_system
+        self.selected = selected
+
 
 class PackageWorker(QThread):
     """패키지 정보를 가져오는 워커 스레드"""
@@ -20,107 +342,285 @@ class PackageWorker(QThread):
     progress_updated = pyqtSignal(int)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, device_id):
-        super().__init__()
+    # pm list packages 출력의 "package:<이름>" 줄
+    _PACKAGE_RE = re.compile(r'^package:(\S+)', re.M)
+    # 전체 목록과 시스템 앱 목록을 한 번에 받을 때 두 출력 사이의 구분자 (뒤에 첫 명령의 종료 코드)
+    _SYSTEM_MARK = "__SYSTEM_PACKAGES__"
+    _LIST_CMD = f"pm list packages; echo {_SYSTEM_MARK}$?; pm list packages -s"
+    # dumpsys 출력에서 상세 정보에 필요한 줄만 디바이스에서 걸러냄
+    _METADATA_GREP = ("grep -E '^  Package \\[|^Hidden system packages:|"
+                      "^ +(appId|versionName|versionCode|installerPackageName|timeStamp|lastUpdateTime)=|User 0: '")
+    _METADATA_CMD = f"dumpsys package packages 2>/dev/null | {_METADATA_GREP}"
+    _SECTION_RE = re.compile(r'  Package \[([^\]]+)\]')
+    # 여러 패키지의 dumpsys 를 이어 받을 때 패키지마다 출력 뒤에 붙이는 구분자
+    _DETAIL_MARK = "__PKGDETAIL__"
+    # 한 번의 셸 왕복으로 dumpsys 를 받는 패키지 수
+    DETAIL_BATCH_SIZE = 20
+
+    def __init__(self, device_id, parent=None, use_cache=True):
+        super().__init__(parent)
         self.device_id = device_id
+        self.use_cache = use_cache
 
     def run(self):
+        # 최근에 읽은 목록이 있으면 adb 호출 없이 바로 표시
+        cached = _PACKAGE_LIST_CACHE.get(self.device_id) if self.use_cache else None
+        if cached is not None:
+            self.progress_updated.emit(100)
+            self.package_loaded.emit([PackageRow(name, is_system) for name, is_system in cached])
+            return
+
         try:
-            # 설치된 패키지 목록 가져오기
+            # 연결되지 않은 디바이스는 긴 타임아웃을 기다리지 않고 바로 오류 처리
+            if not is_device_online(self.device_id):
+                self.error_occurred.emit(f"디바이스에 연결할 수 없습니다: {self.device_id}")
+                return
+
+            # 설치된 패키지 목록과 시스템 앱 목록을 adb shell 세션에 한 번에 요청
             self.progress_updated.emit(30)
-            cmd = f"adb -s {self.device_id} shell pm list packages"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
+            result = AdbShell.get(self.device_id).run(self._LIST_CMD)
+            packages_output, found, rest = result.stdout.partition(self._SYSTEM_MARK)
+            list_returncode, _, system_output = rest.partition('\n')
 
-            if result.returncode != 0:
-                self.error_occurred.emit(f"패키지 목록을 가져올 수 없습니다: {result.stderr}")
+            if not found or list_returncode.strip() != '0':
+                self.error_occurred.emit(f"패키지 목록을 가져올 수 없습니다: {packages_output}")
                 return
 
-            packages = []
-            package_lines = result.stdout.strip().split('\n')
-
             self.progress_updated.emit(60)
 
-            # 시스템 앱 목록 가져오기
-            system_cmd = f"adb -s {self.device_id} shell pm list packages -s"
-            system_result = subprocess.run(system_cmd, shell=True, capture_output=True, text=True, timeout=30)
-            system_packages = set()
-
-            if system_result.returncode == 0:
-                for line in system_result.stdout.strip().split('\n'):
-                    if line.startswith('package:'):
-                        system_packages.add(line.replace('package:', ''))
+            # 시스템 앱 목록 (이름을 intern 해 두 목록이 같은 문자열 객체를 공유하고 비교는 포인터로 끝남)
+            system_packages = frozenset()
+            if result.returncode == 0:
+                system_packages = frozenset(map(sys.intern, self._PACKAGE_RE.findall(system_output)))
 
             self.progress_updated.emit(80)
 
             # 패키지 정보 구성
-            for i, line in enumerate(package_lines):
-                if line.startswith('package:'):
-                    package_name = line.replace('package:', '')
-                    is_system = package_name in system_packages
-                    packages.append({
-                        'name': package_name,
-                        'is_system': is_system,
-                        'selected': False
-                    })
-
-            packages.sort(key=lambda x: x['name'])
+            packages = [PackageRow(package_name, package_name in system_packages)
+                        for package_name in map(sys.intern, self._PACKAGE_RE.findall(packages_output))]
+
+            packages.sort(key=attrgetter('name'))
+            _PACKAGE_LIST_CACHE.put(self.device_id,
+                                    tuple((package.name, package.is_system) for package in packages))
 
             self.progress_updated.emit(100)
             self.package_loaded.emit(packages)
 
         except subprocess.TimeoutExpired:
             self.error_occurred.emit("명령 실행 시간이 초과되었습니다.")
+            return
         except Exception as e:
             self.error_occurred.emit(f"오류가 발생했습니다: {str(e)}")
+            return
+
+        # 목록 표시 후 상세 정보를 미리 받아 두기 (실패해도 상세 창에서 개별 조회)
+        try:
+            self._bulk_fetch_metadata()
+        except (subprocess.SubprocessError, OSError):
+            pass
+
+    def _bulk_fetch_metadata(self):
+        """모든 패키지의 상세 정보를 dumpsys 한 번으로 가져와 캐시에 저장"""
+        sections = {}
+        current = None
+        for line in AdbShell.get(self.device_id).stream(self._METADATA_CMD):
+            if line.startswith('Hidden system packages:'):
+                break
+            match = self._SECTION_RE.match(line)
+            if match:
+                current = sections.setdefault(sys.intern(match.group(1)), [])
+            elif current is not None:
+                current.append(line)
+
+        for package_name, lines in sections.items():
+            _DETAIL_CACHE.put((self.device_id, package_name), PackageDetailDialog.parse_package_info(lines))
+
+    @classmethod
+    def fetch_package_dumpsys(cls, device_id, package_names):
+        """여러 패키지의 dumpsys 원본 출력을 셸 왕복 한 번으로 가져와 캐시에 저장"""
+        command = "; ".join(f"dumpsys package {shlex.quote(package)} 2>/dev/null; echo {cls._DETAIL_MARK}"
+                            for package in package_names)
+        names = iter(package_names)
+        lines = []
+        for line in AdbShell.get(device_id).stream(command, timeout=30 * len(package_names)):
+            pos = line.find(cls._DETAIL_MARK)
+            if pos < 0:
+                lines.append(line)
+                continue
+            # 출력이 줄바꿈 없이 끝났으면 구분자가 마지막 줄 뒤에 붙어 옴
+            if pos > 0:
+                lines.append(line[:pos])
+            _DUMPSYS_CACHE.put((device_id, next(names)), ''.join(lines))
+            lines = []
+
+    @classmethod
+    def fetch_package_details(cls, device_id, package_names):
+        """지정한 패키지들의 상세 정보를 묶음마다 셸 왕복 한 번으로 가져와 캐시에 저장"""
+        session = AdbShell.get(device_id)
+        for start in range(0, len(package_names), cls.DETAIL_BATCH_SIZE):
+            batch = package_names[start:start + cls.DETAIL_BATCH_SIZE]
+            command = "; ".join(f"dumpsys package {shlex.quote(package)} 2>/dev/null | {cls._METADATA_GREP}; "
+                                f"echo {cls._DETAIL_MARK}" for package in batch)
+            names = iter(batch)
+            lines = []
+            hidden = False
+            for line in session.stream(command, timeout=30 + 2 * len(batch)):
+                if line.startswith(cls._DETAIL_MARK):
+                    _DETAIL_CACHE.put((device_id, next(names)), PackageDetailDialog.parse_package_info(lines))
+                    lines = []
+                    hidden = False
+                elif line.startswith('Hidden system packages:'):
+                    # 업데이트된 시스템 앱의 공장 버전 정보는 사용하지 않음
+                    hidden = True
+                elif not hidden:
+                    lines.append(line)
 
 
 class PackageOperationWorker(QThread):
     """패키지 작업을 처리하는 워커 스레드"""
     progress_updated = pyqtSignal(int, str)  # 진행률, 현재 처리중인 패키지명
     operation_completed = pyqtSignal(list)  # 실패한 패키지 목록
-    error_occurred = pyqtSignal(str)
+
+    # 작업별 pm 명령 (모두 같은 adb shell 세션에서 실행)
+    _PM_COMMANDS = {
+        "uninstall": "pm uninstall",
+        "disable": "pm disable-user",
+        "enable": "pm enable",
+        "reset": "pm default-state"
+    }
+    # 작업 전에 이미 목표 상태인 패키지를 거르는 pm list 필터 (재설정은 현재 상태로 판단할 수 없어 제외)
+    _STATE_FILTERS = {
+        "disable": "-d",
+        "enable": "-e"
+    }
+
+    # 한 번의 셸 왕복으로 보내는 패키지 수 (취소는 묶음 사이에서 확인)
+    BATCH_SIZE = 10
+    # 패키지 명령마다 출력 뒤에 붙이는 종료 코드 표시
+    _RC_MARK = "__PKGRC__"
+    # 진행률 갱신 최소 간격 (초, 약 30 Hz)
+    PROGRESS_INTERVAL = 0.033
 
     def __init__(self, device_id, packages, operation):
         super().__init__()
         self.device_id = device_id
         self.packages = packages
         self.operation = operation
+        # 작업이 성공한 패키지 (취소로 실행되지 않은 패키지는 성공/실패 어디에도 없음)
+        self.succeeded_packages = []
+        # 실패한 패키지별 사유 (pm 출력 등)
+        self.failure_reasons = {}
+        # 디바이스 연결 끊김처럼 개별 패키지와 무관한 오류 (있으면 작업 전체 실패로 알림)
+        self.transport_error = None
         self._is_cancelled = False
+        self._last_progress = -1
+        self._last_progress_time = 0.0
 
     def run(self):
         failed_packages = []
         total_packages = len(self.packages)
+        # 패키지마다 adb 프로세스를 띄우지 않고 디바이스의 영구 셸 세션에 명령을 묶어서 보냄
+        try:
+            session = AdbShell.get(self.device_id)
+        except OSError as e:
+            # 프로그램 종료 중에는 명령을 보내지 않고 모두 실패 처리
+            self.transport_error = str(e)
+            self.operation_completed.emit(list(self.packages))
+            return
+        pm_command = self._PM_COMMANDS[self.operation]
+        packages = self._skip_unchanged(session, self.packages)
+        # 건너뛴 패키지는 이미 완료된 것으로 진행률에 반영
+        skipped = total_packages - len(packages)
 
-        for i, package in enumerate(self.packages):
+        for start in range(0, len(packages), self.BATCH_SIZE):
             if self._is_cancelled:
                 break
 
+            batch = packages[start:start + self.BATCH_SIZE]
+            command = "; ".join(f"{pm_command} {shlex.quote(package)}; echo {self._RC_MARK}$?"
+                                for package in batch)
+            done = 0
+
             try:
                 # 진행 상황 업데이트
-                progress = int((i / total_packages) * 100)
-                self.progress_updated.emit(progress, package)
-
-                if self.operation == "uninstall":
-                    cmd = f"adb -s {self.device_id} uninstall {package}"
-                elif self.operation == "disable":
-                    cmd = f"adb -s {self.device_id} shell pm disable-user {package}"
-                elif self.operation == "enable":
-                    cmd = f"adb -s {self.device_id} shell pm enable {package}"
-                elif self.operation == "reset":
-                    cmd = f"adb -s {self.device_id} shell pm default-state {package}"
-
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-
-                if result.returncode != 0 or (self.operation == "uninstall" and "Failure" in result.stdout):
-                    failed_packages.append(package)
+                self._report_progress(int(((skipped + start) / total_packages) * 100), batch[0])
+
+                # 출력은 패키지 순서대로 "<pm 출력> __PKGRC__<종료 코드>" 형태로 이어짐
+                output = []
+                for line in session.stream(command, timeout=30 + 2 * len(batch)):
+                    pos = line.find(self._RC_MARK)
+                    if pos < 0:
+                        output.append(line)
+                        continue
+                    output.append(line[:pos])
+                    returncode = line[pos + len(self._RC_MARK):].strip()
+                    message = ' '.join(part.strip() for part in output if part.strip())
+                    if returncode != "0" or (self.operation == "uninstall" and "Failure" in message):
+                        failed_packages.append(batch[done])
+                        self.failure_reasons[batch[done]] = message or f"종료 코드 {returncode}"
+                    else:
+                        self.succeeded_packages.append(batch[done])
+                    output = []
+                    done += 1
+                    if done < len(batch):
+                        self._report_progress(int(((skipped + start + done) / total_packages) * 100), batch[done])
+
+                # 결과를 받지 못한 패키지는 실패로 처리
+                failed_packages.extend(batch[done:])
 
             except Exception as e:
-                failed_packages.append(package)
+                failed_packages.extend(batch[done:])
+                # 디바이스 연결이 끊겼으면 (타임아웃, USB 분리로 세션 종료 등) 남은 패키지는 보내지 않고 모두 실패 처리
+                _DEVICE_STATE_CACHE.pop(self.device_id)
+                if not is_device_online(self.device_id):
+                    failed_packages.extend(packages[start + len(batch):])
+                    self.transport_error = f"디바이스 연결이 끊어졌습니다: {self.device_id}"
+                    break
+                if isinstance(e, subprocess.TimeoutExpired):
+                    reason = "명령 실행 시간이 초과되었습니다."
+                else:
+                    reason = str(e)
+                for package in batch[done:]:
+                    self.failure_reasons[package] = reason
+
+        # 패키지 상태가 바뀌었으므로 다음 로드 때는 목록을 다시 읽음
+        _PACKAGE_LIST_CACHE.pop(self.device_id)
 
         # 작업 완료
         self.progress_updated.emit(100, "완료")
         self.operation_completed.emit(failed_packages)
 
+    def _skip_unchanged(self, session, packages):
+        """이미 목표 상태인 패키지는 성공으로 처리하고 실제로 명령을 보낼 패키지만 반환"""
+        state_filter = self._STATE_FILTERS.get(self.operation)
+        if not state_filter:
+            return packages
+        try:
+            # 디바이스에서 걸러진 목록만 받아 옴 (전체 목록보다 출력이 작음)
+            result = session.run(f"pm list packages {state_filter}", timeout=30)
+        except Exception:
+            return packages
+        if result.returncode != 0:
+            return packages
+
+        unchanged = set(PackageWorker._PACKAGE_RE.findall(result.stdout))
+        pending = []
+        for package in packages:
+            if package in unchanged:
+                self.succeeded_packages.append(package)
+            else:
+                pending.append(package)
+        return pending
+
+    def _report_progress(self, progress, current_package):
+        """진행 상황 전달 (값이 바뀌었고 마지막 전달 후 일정 시간이 지났을 때만)"""
+        now = time.monotonic()
+        if progress == self._last_progress or now - self._last_progress_time < self.PROGRESS_INTERVAL:
+            return
+        self._last_progress = progress
+        self._last_progress_time = now
+        self.progress_updated.emit(progress, current_package)
+
     def cancel(self):
         """작업 취소"""
         self._is_cancelled = True
@@ -130,21 +630,81 @@ class ProgressDialog(QDialog):
     """패키지 작업 진행 상황을 표시하는 다이얼로그"""
     cancel_requested = pyqtSignal()
 
+    # 다이얼로그를 열 때마다 문자열을 새로 만들지 않도록 스타일시트를 한 번만 정의
+    _TITLE_QSS = "color: #2c3e50; margin-bottom: 10px;"
+    _CURRENT_PACKAGE_QSS = """
+        color: #34495e;
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 4px;
+        padding: 8px;
+        margin: 5px;
+    """
+    _CURRENT_PACKAGE_DONE_QSS = """
+        color: #27ae60;
+        background-color: #d5f4e6;
+        border: 1px solid #27ae60;
+        border-radius: 4px;
+        padding: 8px;
+        margin: 5px;
+        font-weight: bold;
+    """
+    _PROGRESS_BAR_QSS = """
+        QProgressBar {
+            border: 1px solid #bdc3c7;
+            border-radius: 8px;
+            text-align: center;
+            font-weight: bold;
+            background-color: #ecf0f1;
+        }
+        QProgressBar::chunk {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #3498db, stop:1 #2980b9);
+            border-radius: 7px;
+        }
+    """
+    _STATUS_QSS = "color: #7f8c8d;"
+    _CANCEL_BUTTON_QSS = """
+        QPushButton {
+            background-color: #e74c3c;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px 16px;
+        }
+        QPushButton:hover {
+            background-color: #c0392b;
+        }
+        QPushButton:pressed {
+            background-color: #a93226;
+        }
+    """
+    _DONE_BUTTON_QSS = """
+        QPushButton {
+            background-color: #27ae60;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px 16px;
+        }
+        QPushButton:hover {
+            background-color: #229954;
+        }
+    """
+
+    _OPERATION_NAMES = {
+        "uninstall": "삭제",
+        "disable": "비활성화",
+        "enable": "활성화",
+        "reset": "재설정"
+    }
+
     def __init__(self, operation, total_packages, parent=None):
         super().__init__(parent)
-        self.operation = operation
-        self.total_packages = total_packages
         self.init_ui()
+        self.reset(operation, total_packages)
 
     def init_ui(self):
-        operation_names = {
-            "uninstall": "삭제",
-            "disable": "비활성화",
-            "enable": "활성화",
-            "reset": "재설정"
-        }
-
-        self.setWindowTitle(f"패키지 {operation_names.get(self.operation, '처리')}")
         self.setModal(True)
         self.setFixedSize(500, 300)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
@@ -154,75 +714,38 @@ class ProgressDialog(QDialog):
         layout.setContentsMargins(20, 20, 20, 20)
 
         # 제목
-        title_label = QLabel(f"📦 패키지 {operation_names.get(self.operation, '처리')} 진행 중")
-        title_label.setFont(g_FONT_10_bold_ref)
-        title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet("color: #2c3e50; margin-bottom: 10px;")
-        layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setFont(g_FONT_10_bold_ref)
+        self.title_label.setAlignment(Qt.AlignCenter)
+        self.title_label.setStyleSheet(self._TITLE_QSS)
+        layout.addWidget(self.title_label)
 
         # 현재 처리중인 패키지
-        self.current_package_label = QLabel("준비 중...")
+        self.current_package_label = QLabel()
         self.current_package_label.setFont(g_FONT_10_normal_ref)
         self.current_package_label.setAlignment(Qt.AlignCenter)
-        self.current_package_label.setStyleSheet("""
-            color: #34495e; 
-            background-color: #f8f9fa;
-            border: 1px solid #dee2e6;
-            border-radius: 4px;
-            padding: 8px;
-            margin: 5px;
-        """)
         layout.addWidget(self.current_package_label)
 
         # 진행률 표시
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #bdc3c7;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-                background-color: #ecf0f1;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3498db, stop:1 #2980b9);
-                border-radius: 7px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(self._PROGRESS_BAR_QSS)
         layout.addWidget(self.progress_bar)
 
         # 진행 상태 라벨
-        self.status_label = QLabel(f"0 / {self.total_packages} 완료")
+        self.status_label = QLabel()
         self.status_label.setFont(g_FONT_10_normal_ref)
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("color: #7f8c8d;")
+        self.status_label.setStyleSheet(self._STATUS_QSS)
         layout.addWidget(self.status_label)
 
         # 취소 버튼
         button_layout = QHBoxLayout()
         button_layout.addStretch()
 
-        self.cancel_button = QPushButton("취소")
+        self.cancel_button = QPushButton()
         self.cancel_button.setFont(g_FONT_10_bold_ref)
         self.cancel_button.setFixedSize(100, 35)
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
         self.cancel_button.clicked.connect(self.on_cancel_clicked)
         button_layout.addWidget(self.cancel_button)
 
@@ -231,6 +754,21 @@ class ProgressDialog(QDialog):
 
         self.setLayout(layout)
 
+    def reset(self, operation, total_packages):
+        """새 작업을 위해 다이얼로그 상태 초기화 (위젯과 스타일시트는 다시 만들지 않음)"""
+        self.operation = operation
+        self.total_packages = total_packages
+        operation_name = self._OPERATION_NAMES.get(operation, '처리')
+
+        self.setWindowTitle(f"패키지 {operation_name}")
+        self.title_label.setText(f"📦 패키지 {operation_name} 진행 중")
+        self.current_package_label.setText("준비 중...")
+        self.current_package_label.setStyleSheet(self._CURRENT_PACKAGE_QSS)
+        self.progress_bar.setValue(0)
+        self.status_label.setText(f"0 / {total_packages} 완료")
+        self.cancel_button.setText("취소")
+        self.cancel_button.setStyleSheet(self._CANCEL_BUTTON_QSS)
+
     @pyqtSlot(int, str)
     def update_progress(self, progress, current_package):
         """진행 상황 업데이트"""
@@ -238,28 +776,9 @@ class ProgressDialog(QDialog):
 
         if current_package == "완료":
             self.current_package_label.setText("✅ 작업이 완료되었습니다!")
-            self.current_package_label.setStyleSheet("""
-                color: #27ae60; 
-                background-color: #d5f4e6;
-                border: 1px solid #27ae60;
-                border-radius: 4px;
-                padding: 8px;
-                margin: 5px;
-                font-weight: bold;
-            """)
+            self.current_package_label.setStyleSheet(self._CURRENT_PACKAGE_DONE_QSS)
             self.cancel_button.setText("✅ 완료")
-            self.cancel_button.setStyleSheet("""
-                QPushButton {
-                    background-color: #27ae60;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                }
-                QPushButton:hover {
-                    background-color: #229954;
-                }
-            """)
+            self.cancel_button.setStyleSheet(self._DONE_BUTTON_QSS)
         else:
             self.current_package_label.setText(f"처리 중: {current_package}")
 
@@ -297,18 +816,122 @@ class ProgressDialog(QDialog):
 class PackageDetailDialog(QDialog):
     """패키지 상세 정보를 표시하는 서브 윈도우 (이쁘게 구성)"""
 
+    # dumpsys 출력 한 줄에서 필요한 값을 찾는 정규표현식 (필드=값 또는 User 0의 enabled 값)
+    _DUMPSYS_PATTERN = (r'[ \t]*(?:(appId|versionName|versionCode|installerPackageName|timeStamp|lastUpdateTime)=([^=\r\n]*)'
+                        r'|User 0: .*? enabled=(\S)'
+                        r'|(Hidden system packages:))')
+    _DUMPSYS_RE = re.compile(_DUMPSYS_PATTERN)
+    # 캐시된 전체 출력 문자열을 줄로 나누지 않고 바로 훑는 버전
+    _DUMPSYS_TEXT_RE = re.compile('^' + _DUMPSYS_PATTERN, re.M)
+    # dumpsys 필드명 -> info 키
+    _DUMPSYS_FIELDS = {
+        'appId': 'appId',
+        'versionName': 'version_name',
+        'versionCode': 'version_code',
+        'installerPackageName': 'installer',
+        'timeStamp': 'timestamp',
+        'lastUpdateTime': 'last_update'
+    }
+    enable_states = {
+        0: "ENABLED_STATE_DEFAULT",
+        1: "ENABLED_STATE_ENABLED",
+        2: "ENABLED_STATE_DISABLED",
+        3: "ENABLED_STATE_DISABLED_USER",
+        4: "ENABLED_STATE_DISABLED_UNTIL_USED"
+    }
+
+    # 다이얼로그를 열 때마다 문자열을 새로 만들지 않도록 스타일시트를 한 번만 정의
+    _TITLE_FRAME_QSS = """
+        QFrame {
+            background-color: #f0f8ff;
+            border: 2px solid #4682b4;
+            border-radius: 8px;
+            padding: 10px;
+        }
+    """
+    _INFO_FRAME_QSS = """
+        QFrame {
+            background-color: #ffffff;
+            border: 1px solid #bdc3c7;
+            border-radius: 8px;
+            padding: 15px;
+        }
+    """
+    # 정보 입력 폼의 라벨/입력칸 (필드마다가 아니라 폼에 한 번만 적용)
+    _FORM_QSS = """
+        QLabel {
+            color: #2c3e50;
+            min-width: 150px;
+        }
+        QLineEdit {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+            padding: 8px;
+            color: #495057;
+        }
+        QLineEdit:focus {
+            border-color: #80bdff;
+            background-color: #ffffff;
+        }
+    """
+    _BUTTON_FRAME_QSS = """
+        QFrame {
+            background-color: #f8f9fa;
+            border-top: 1px solid #dee2e6;
+            border-radius: 0px;
+        }
+    """
+    _COPY_BUTTON_QSS = """
+        QPushButton {
+            background-color: #28a745;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px 16px;
+        }
+        QPushButton:hover {
+            background-color: #218838;
+        }
+        QPushButton:pressed {
+            background-color: #1e7e34;
+        }
+        QPushButton:disabled {
+            background-color: #6c757d;
+            color: #ffffff;
+        }
+    """
+    _CLOSE_BUTTON_QSS = """
+        QPushButton {
+            background-color: #6c757d;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 8px 16px;
+        }
+        QPushButton:hover {
+            background-color: #5a6268;
+        }
+        QPushButton:pressed {
+            background-color: #545b62;
+        }
+    """
+    _COPY_TOAST_QSS = """
+        QLabel {
+            background-color: #f8f9fa;
+            color: #2c3e50;
+            font-size: 11px;
+            border: 1px solid #bdc3c7;
+            border-radius: 6px;
+            padding: 10px 16px;
+        }
+    """
+
     def __init__(self, device_id, package_name, parent=None):
         super().__init__(parent)
         self.device_id = device_id
         self.package_name = package_name
         self.package_info = {}
-        self.enable_states = {
-            0: "ENABLED_STATE_DEFAULT",
-            1: "ENABLED_STATE_ENABLED",
-            2: "ENABLED_STATE_DISABLED",
-            3: "ENABLED_STATE_DISABLED_USER",
-            4: "ENABLED_STATE_DISABLED_UNTIL_USED"
-        }
         self.init_ui()
         self.load_package_detail()
 
@@ -327,14 +950,7 @@ class PackageDetailDialog(QDialog):
         # 제목 영역
         title_frame = QFrame()
         title_frame.setFrameStyle(QFrame.StyledPanel)
-        title_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f0f8ff;
-                border: 2px solid #4682b4;
-                border-radius: 8px;
-                padding: 10px;
-            }
-        """)
+        title_frame.setStyleSheet(self._TITLE_FRAME_QSS)
         title_layout = QVBoxLayout(title_frame)
 
         title_label = QLabel("📦 패키지 상세 정보")
@@ -362,14 +978,7 @@ class PackageDetailDialog(QDialog):
         # 정보 영역
         info_frame = QFrame()
         info_frame.setFrameStyle(QFrame.StyledPanel)
-        info_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #bdc3c7;
-                border-radius: 8px;
-                padding: 15px;
-            }
-        """)
+        info_frame.setStyleSheet(self._INFO_FRAME_QSS)
         info_layout = QVBoxLayout(info_frame)
 
         # 로딩 라벨
@@ -381,6 +990,7 @@ class PackageDetailDialog(QDialog):
 
         # 정보 입력 폼 (초기에는 숨김)
         self.form_widget = QWidget()
+        self.form_widget.setStyleSheet(self._FORM_QSS)
         form_layout = QFormLayout(self.form_widget)
         form_layout.setSpacing(15)
         form_layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
@@ -389,24 +999,10 @@ class PackageDetailDialog(QDialog):
         def create_info_field(label_text, icon=""):
             label = QLabel(f"{icon} {label_text}")
             label.setFont(g_FONT_10_bold_ref)
-            label.setStyleSheet("color: #2c3e50; min-width: 150px;")
 
             edit = QLineEdit()
             edit.setReadOnly(True)
             edit.setFont(g_FONT_10_normal_ref)
-            edit.setStyleSheet("""
-                QLineEdit {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                    padding: 8px;
-                    color: #495057;
-                }
-                QLineEdit:focus {
-                    border-color: #80bdff;
-                    background-color: #ffffff;
-                }
-            """)
             return label, edit
 
         # 각 필드 생성
@@ -440,13 +1036,7 @@ class PackageDetailDialog(QDialog):
 
         # 버튼 영역
         button_frame = QFrame()
-        button_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border-top: 1px solid #dee2e6;
-                border-radius: 0px;
-            }
-        """)
+        button_frame.setStyleSheet(self._BUTTON_FRAME_QSS)
         button_layout = QHBoxLayout(button_frame)
         button_layout.setContentsMargins(15, 15, 15, 15)
 
@@ -454,25 +1044,7 @@ class PackageDetailDialog(QDialog):
         self.copy_button = QPushButton("📋 복사")
         self.copy_button.setFont(g_FONT_10_bold_ref)
         self.copy_button.setFixedSize(100, 35)
-        self.copy_button.setStyleSheet("""
-            QPushButton {
-                background-color: #28a745;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-            QPushButton:pressed {
-                background-color: #1e7e34;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-                color: #ffffff;
-            }
-        """)
+        self.copy_button.setStyleSheet(self._COPY_BUTTON_QSS)
         self.copy_button.clicked.connect(self.copy_package_info)
         self.copy_button.setEnabled(False)  # 초기에는 비활성화
         button_layout.addWidget(self.copy_button)
@@ -483,56 +1055,77 @@ class PackageDetailDialog(QDialog):
         close_button = QPushButton("❌ 닫기")
         close_button.setFont(g_FONT_10_bold_ref)
         close_button.setFixedSize(100, 35)
-        close_button.setStyleSheet("""
-            QPushButton {
-                background-color: #6c757d;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #5a6268;
-            }
-            QPushButton:pressed {
-                background-color: #545b62;
-            }
-        """)
+        close_button.setStyleSheet(self._CLOSE_BUTTON_QSS)
         close_button.clicked.connect(self.close)
         button_layout.addWidget(close_button)
 
         main_layout.addWidget(button_frame)
         self.setLayout(main_layout)
 
+        # 복사 완료 알림 (레이아웃 밖에서 다이얼로그 위에 잠시 표시)
+        self.copy_toast = QLabel("📋 패키지 상세 정보가 클립보드에 복사되었습니다!", self)
+        self.copy_toast.setStyleSheet(self._COPY_TOAST_QSS)
+        self.copy_toast.adjustSize()
+        self.copy_toast.hide()
+        self.copy_toast_timer = QTimer(self)
+        self.copy_toast_timer.setSingleShot(True)
+        self.copy_toast_timer.timeout.connect(self.copy_toast.hide)
+
     def load_package_detail(self):
         """패키지 상세 정보 로드"""
-        # 백그라운드에서 정보 로드
-        self.worker = QThread()
-        self.worker.run = self.get_package_detail
-        self.worker.start()
+        # 캐시에 있으면 스레드 없이 바로 표시
+        key = (self.device_id, self.package_name)
+        info = _DETAIL_CACHE.get(key)
+        if info is None:
+            raw = _DUMPSYS_CACHE.get(key)
+            if raw is not None:
+                info = self.parse_package_info(raw)
+                _DETAIL_CACHE.put(key, info)
+        if info is not None:
+            self.update_package_detail(info)
+            return
+
+        # 공용 스레드 풀에서 정보 로드
+        _ADB_POOL.start(AdbTask(self.get_package_detail))
 
     def get_package_detail(self):
-        """패키지 상세 정보 가져오기"""
+        """패키지 상세 정보 가져오기 (dumpsys 출력을 받는 대로 한 줄씩 파싱)"""
+        key = (self.device_id, self.package_name)
         try:
-            cmd = f"adb -s {self.device_id} shell dumpsys package {self.package_name}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                info = self.parse_package_info(result.stdout)
-                QMetaObject.invokeMethod(self, "update_package_detail",
-                                         Qt.QueuedConnection,
-                                         Q_ARG(dict, info))
-            else:
-                QMetaObject.invokeMethod(self, "update_error",
-                                         Qt.QueuedConnection,
-                                         Q_ARG(str, "패키지 정보를 가져올 수 없습니다."))
+            info = _DETAIL_CACHE.get(key)
+            if info is None:
+                raw = _DUMPSYS_CACHE.get(key)
+                if raw is not None:
+                    info = self.parse_package_info(raw)
+                elif not is_device_online(self.device_id):
+                    QMetaObject.invokeMethod(self, "update_error",
+                                             Qt.QueuedConnection,
+                                             Q_ARG(str, f"디바이스에 연결할 수 없습니다: {self.device_id}"))
+                    return
+                else:
+                    # stderr 는 디바이스에서 버려 파싱할 줄만 전송받음
+                    lines = AdbShell.get(self.device_id).stream(f"dumpsys package {shlex.quote(self.package_name)} 2>/dev/null")
+                    try:
+                        info = self.parse_package_info(lines)
+                    finally:
+                        # 필요한 값을 다 찾아 중간에 멈췄으면 남은 출력은 세션에서 버림
+                        lines.close()
+                _DETAIL_CACHE.put(key, info)
+            QMetaObject.invokeMethod(self, "update_package_detail",
+                                     Qt.QueuedConnection,
+                                     Q_ARG(dict, info))
+        except subprocess.CalledProcessError:
+            QMetaObject.invokeMethod(self, "update_error",
+                                     Qt.QueuedConnection,
+                                     Q_ARG(str, "패키지 정보를 가져올 수 없습니다."))
         except Exception as e:
             QMetaObject.invokeMethod(self, "update_error",
                                      Qt.QueuedConnection,
                                      Q_ARG(str, str(e)))
 
-    def parse_package_info(self, dumpsys_output):
-        """dumpsys 출력에서 필요한 정보 파싱"""
+    @classmethod
+    def parse_package_info(cls, lines):
+        """dumpsys 출력 (줄들 또는 전체 문자열)에서 필요한 정보 파싱"""
         info = {
             'appId': '',
             'enabled': '',
@@ -543,31 +1136,36 @@ class PackageDetailDialog(QDialog):
             'last_update': ''
         }
 
-        lines = dumpsys_output.split('\n')
-
-        for line in lines:
-            line = line.strip()
-
-            if line.startswith('appId='):
-                info['appId'] = line.split('=')[1] if '=' in line else ''
-            elif line.startswith('User 0: '):
-                enabled_value = line.split(' enabled=')[1][0]
+        # 아직 찾지 못한 값 (모두 찾으면 나머지 줄은 읽지 않음)
+        # 설치된 패키지 블록의 값만 사용하고 뒤에 오는 시스템 원본(Hidden system packages) 블록은 읽지 않음
+        remaining = set(info)
+        if isinstance(lines, str):
+            matches = cls._DUMPSYS_TEXT_RE.finditer(lines)
+        else:
+            matches = map(cls._DUMPSYS_RE.match, lines)
+        for match in matches:
+            if not match:
+                continue
+            key, value, enabled_value, hidden = match.groups()
+            if hidden:
+                break
+            if key:
+                field = cls._DUMPSYS_FIELDS[key]
+                if field not in remaining:
+                    continue
+                if key == 'versionCode':
+                    value = value.split(' ', 1)[0]
+                info[field] = value.strip()
+                remaining.discard(field)
+            elif 'enabled' in remaining:
                 try:
                     state_code = int(enabled_value)
-                    info['enabled'] = f"{state_code} ({self.enable_states.get(state_code, 'UNKNOWN')})"
-                except:
+                    info['enabled'] = f"{state_code} ({cls.enable_states.get(state_code, 'UNKNOWN')})"
+                except ValueError:
                     info['enabled'] = enabled_value
-            elif line.startswith('versionName='):
-                info['version_name'] = line.split('=')[1] if '=' in line else ''
-            elif line.startswith('versionCode='):
-                version_code = line.split('=')[1] if '=' in line else ''
-                info['version_code'] = version_code.split(' ')[0] if ' ' in version_code else version_code
-            elif line.startswith('installerPackageName='):
-                info['installer'] = line.split('=')[1] if '=' in line else ''
-            elif line.startswith('timeStamp='):
-                info['timestamp'] = line.split('=')[1] if '=' in line else ''
-            elif line.startswith('lastUpdateTime='):
-                info['last_update'] = line.split('=')[1] if '=' in line else ''
+                remaining.discard('enabled')
+            if not remaining:
+                break
 
         return info
 
@@ -619,25 +1217,15 @@ Last Update Time: {self.package_info.get('last_update', 'N/A')}"""
         self.show_copy_success_message()
 
     def show_copy_success_message(self):
-        """복사 성공 메시지 표시 (임시 툴팁 스타일)"""
-        msg = QMessageBox(self)
-        msg.setWindowTitle("복사 완료")
-        msg.setText("📋 패키지 상세 정보가 클립보드에 복사되었습니다!")
-        msg.setIcon(QMessageBox.Information)
-        msg.setStandardButtons(QMessageBox.Ok)
-        msg.setStyleSheet("""
-            QMessageBox {
-                background-color: #f8f9fa;
-            }
-            QMessageBox QLabel {
-                color: #2c3e50;
-                font-size: 11px;
-            }
-        """)
+        """복사 성공 메시지 표시 (다이얼로그를 막지 않는 임시 알림)"""
+        # 다이얼로그 가운데에 표시
+        self.copy_toast.move((self.width() - self.copy_toast.width()) // 2,
+                             (self.height() - self.copy_toast.height()) // 2)
+        self.copy_toast.raise_()
+        self.copy_toast.show()
 
-        # 자동으로 1.5초 후에 닫기
-        QTimer.singleShot(1500, msg.accept)
-        msg.exec_()
+        # 1.5초 후에 숨김 (연속으로 복사하면 다시 1.5초)
+        self.copy_toast_timer.start(1500)
 
 
 class PackageInfoDialog(QDialog):
@@ -693,28 +1281,41 @@ class PackageInfoDialog(QDialog):
 
     def load_package_info(self):
         """패키지 정보 로드"""
+        # 캐시에 있으면 스레드 없이 바로 표시
+        raw = _DUMPSYS_CACHE.get((self.device_id, self.package_name))
+        if raw is not None:
+            self.update_package_info(raw)
+            return
+
         self.text_edit.setText("패키지 정보를 로드")
 
-        # 백그라운드에서 정보 로드
-        self.worker = QThread()
-        self.worker.run = self.get_package_info
-        self.worker.start()
+        # 공용 스레드 풀에서 정보 로드
+        _ADB_POOL.start(AdbTask(self.get_package_info))
 
     def get_package_info(self):
         """패키지 정보 가져오기 (백그라운드 스레드에서 실행)"""
+        key = (self.device_id, self.package_name)
         try:
-            cmd = f"adb -s {self.device_id} shell dumpsys package {self.package_name}"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-
-            if result.returncode == 0:
-                # 메인 스레드에서 UI 업데이트
-                QMetaObject.invokeMethod(self, "update_package_info",
-                                         Qt.QueuedConnection,
-                                         Q_ARG(str, result.stdout))
-            else:
-                QMetaObject.invokeMethod(self, "update_package_info",
-                                         Qt.QueuedConnection,
-                                         Q_ARG(str, f"패키지 정보를 가져올 수 없습니다: {result.stderr}"))
+            raw = _DUMPSYS_CACHE.get(key)
+            if raw is None:
+                if not is_device_online(self.device_id):
+                    QMetaObject.invokeMethod(self, "update_package_info",
+                                             Qt.QueuedConnection,
+                                             Q_ARG(str, f"디바이스에 연결할 수 없습니다: {self.device_id}"))
+                    return
+                result = AdbShell.get(self.device_id).run(f"dumpsys package {shlex.quote(self.package_name)} 2>/dev/null")
+                if result.returncode != 0:
+                    QMetaObject.invokeMethod(self, "update_package_info",
+                                             Qt.QueuedConnection,
+                                             Q_ARG(str, f"패키지 정보를 가져올 수 없습니다: {result.stderr}"))
+                    return
+                raw = result.stdout
+                _DUMPSYS_CACHE.put(key, raw)
+
+            # 메인 스레드에서 UI 업데이트
+            QMetaObject.invokeMethod(self, "update_package_info",
+                                     Qt.QueuedConnection,
+                                     Q_ARG(str, raw))
         except Exception as e:
             QMetaObject.invokeMethod(self, "update_package_info",
                                      Qt.QueuedConnection,
@@ -732,12 +1333,238 @@ class PackageInfoDialog(QDialog):
         QMessageBox.information(self, "복사 완료", "패키지 정보가 클립보드에 복사되었습니다.")
 
 
-class CheckBoxTableWidget(QTableWidget):
-    """체크박스가 포함된 테이블 위젯"""
+class FailureListDialog(QDialog):
+    """작업에 실패한 패키지 목록을 표시하는 모달 대화상자 (한 번 만들어 재사용)"""
 
-    def __init__(self):
-        super().__init__()
-        self.setSortingEnabled(False)  # 기본으로는 비활성화
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.init_ui()
+
+    def init_ui(self):
+        self.setModal(True)
+        self.resize(700, 400)
+        # "?" 아이콘 제거
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowContextHelpButtonHint)
+
+        layout = QVBoxLayout()
+
+        # 안내 문구
+        self.message_label = QLabel()
+        self.message_label.setFont(g_FONT_10_bold_ref)
+        layout.addWidget(self.message_label)
+
+        # 실패 목록 (항목 수와 관계없이 보이는 줄만 그림)
+        self.list_widget = QListWidget()
+        self.list_widget.setFont(g_FONT_10_normal_ref)
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        layout.addWidget(self.list_widget)
+
+        # 버튼 레이아웃
+        button_layout = QHBoxLayout()
+
+        copy_button = QPushButton("복사")
+        copy_button.clicked.connect(self.copy_items)
+        button_layout.addWidget(copy_button)
+
+        button_layout.addStretch()
+
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def set_items(self, title, message, items):
+        """표시할 제목, 안내 문구, 실패 목록 설정"""
+        self.setWindowTitle(title)
+        self.message_label.setText(message)
+        self.list_widget.clear()
+        self.list_widget.addItems(items)
+
+    def copy_items(self):
+        """선택한 항목(선택이 없으면 전체)을 클립보드에 복사"""
+        items = self.list_widget.selectedItems()
+        if items:
+            lines = [item.text() for item in items]
+        else:
+            lines = [self.list_widget.item(row).text() for row in range(self.list_widget.count())]
+        clipboard = QApplication.clipboard()
+        clipboard.setText('\n'.join(lines))
+
+
+class PackageTableModel(QAbstractTableModel):
+    """패키지 행 데이터를 테이블에 보여주는 모델 (행마다 아이템/위젯을 만들지 않음)"""
+    # 사용자가 체크박스를 클릭해 체크 상태를 바꿨을 때 (행, 체크 여부)
+    check_state_changed = pyqtSignal(int, bool)
+
+    HEADERS = ("Index", "선택", "Package Name")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 행 데이터 (PackageRow 목록, 표시 순서와 동일)
+        self._rows = []
+        # 검색 결과로 하이라이트할 행 번호
+        self._highlight_rows = frozenset()
+
+    def set_rows(self, rows):
+        """표시할 행 데이터 설정 (전달된 list 를 그대로 사용하고 정렬도 그 list 에 적용)"""
+        self.beginResetModel()
+        self._rows = rows
+        self._highlight_rows = frozenset()
+        self.endResetModel()
+
+    def is_checked(self, row):
+        """행의 체크 상태 반환"""
+        return self._rows[row].selected
+
+    def set_checked(self, row_indices, checked):
+        """여러 행의 체크 상태를 한 번에 변경 (dataChanged 는 한 번만 발생)"""
+        if not row_indices:
+            return
+        rows = self._rows
+        for row in row_indices:
+            rows[row].selected = checked
+        self.dataChanged.emit(self.index(min(row_indices), 1), self.index(max(row_indices), 1),
+                              [Qt.CheckStateRole])
+
+    def set_highlight_rows(self, row_indices):
+        """검색 결과 행 하이라이트 설정 (Package Name 컬럼 배경만 다시 그림)"""
+        highlight_rows = frozenset(row_indices)
+        changed_rows = highlight_rows ^ self._highlight_rows
+        if not changed_rows:
+            return
+        self._highlight_rows = highlight_rows
+        # 하이라이트가 켜지거나 꺼진 행 범위만 다시 그림
+        self.dataChanged.emit(self.index(min(changed_rows), 2), self.index(max(changed_rows), 2),
+                              [Qt.BackgroundRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        package = self._rows[row]
+
+        if column == 2:
+            # Package Name (시스템 앱은 회색, 검색 결과는 연한 노란색 배경)
+            if role == Qt.DisplayRole:
+                return package.name
+            if role == Qt.ForegroundRole:
+                return g_COLOR_TEXT_system_ref if package.is_system else g_COLOR_TEXT_normal_ref
+            if role == Qt.BackgroundRole:
+                return g_COLOR_BG_highlight_ref if row in self._highlight_rows else g_COLOR_BG_normal_ref
+        elif column == 1:
+            # 체크박스
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if package.selected else Qt.Unchecked
+        elif column == 0:
+            # Index
+            if role == Qt.DisplayRole:
+                return str(row + 1)
+            if role == Qt.TextAlignmentRole:
+                return Qt.AlignCenter
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == 1:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.CheckStateRole or index.column() != 1:
+            return False
+        checked = (value == Qt.Checked)
+        self._rows[index.row()].selected = checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.check_state_changed.emit(index.row(), checked)
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """정렬 - Package Name 컬럼(2)만 허용, 선택/포커스와 하이라이트는 같은 패키지를 따라감"""
+        if column != 2:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        rows = self._rows
+        persistent = self.persistentIndexList()
+        persistent_packages = [rows[index.row()] for index in persistent]
+        highlight_packages = [rows[row] for row in self._highlight_rows]
+
+        rows.sort(key=attrgetter('name'), reverse=(order == Qt.DescendingOrder))
+
+        new_row = {package: row for row, package in enumerate(rows)}
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(new_row[package], index.column())
+             for package, index in zip(persistent_packages, persistent)])
+        self._highlight_rows = frozenset(new_row[package] for package in highlight_packages)
+        self.layoutChanged.emit()
+
+
+class CheckBoxDelegate(QStyledItemDelegate):
+    """체크박스 컬럼을 셀 가운데에 그리고 클릭으로 토글하는 델리게이트 (행마다 위젯을 만들지 않음)"""
+
+    @staticmethod
+    def check_rect(option):
+        """셀 가운데의 체크 표시 영역"""
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        size = QSize(style.pixelMetric(QStyle.PM_IndicatorWidth, option, widget),
+                     style.pixelMetric(QStyle.PM_IndicatorHeight, option, widget))
+        return QStyle.alignedRect(option.direction, Qt.AlignCenter, size, option.rect)
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        checked = (opt.checkState == Qt.Checked)
+
+        # 배경/선택 표시는 체크 표시 없이 그림
+        opt.features &= ~QStyleOptionViewItem.HasCheckIndicator
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+
+        # 체크 표시는 셀 가운데에 그림
+        opt.rect = self.check_rect(option)
+        opt.state = (opt.state & ~QStyle.State_HasFocus) | (QStyle.State_On if checked else QStyle.State_Off)
+        style.drawPrimitive(QStyle.PE_IndicatorItemViewItemCheck, opt, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        flags = index.flags()
+        if not (flags & Qt.ItemIsUserCheckable) or not (flags & Qt.ItemIsEnabled):
+            return False
+
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseButtonDblClick):
+            if event.button() != Qt.LeftButton or not self.check_rect(option).contains(event.pos()):
+                return False
+            # 누름/더블클릭은 체크 영역에서 소비하고 뗄 때 한 번만 토글
+            if event.type() != QEvent.MouseButtonRelease:
+                return True
+            state = Qt.Unchecked if index.data(Qt.CheckStateRole) == Qt.Checked else Qt.Checked
+            return model.setData(index, state, Qt.CheckStateRole)
+
+        return False
+
+
+class CheckBoxTableView(QTableView):
+    """체크박스 컬럼이 있는 패키지 테이블 뷰"""
+    # Space 키로 여러 행의 체크 상태를 일괄 변경했을 때 (행 목록, 새 상태)
+    checkboxes_toggled = pyqtSignal(list, bool)
 
     def keyPressEvent(self, event):
         """키보드 이벤트 처리"""
@@ -750,7 +1577,7 @@ class CheckBoxTableWidget(QTableWidget):
             for index in selected_indexes:
                 selected_rows.add(index.row())
 
-            current_row = self.currentRow()
+            current_row = self.currentIndex().row()
 
             # 포커스된 행이 선택되어 있지 않으면 포커스 행은 제외
             if current_row >= 0:
@@ -763,17 +1590,12 @@ class CheckBoxTableWidget(QTableWidget):
                         selected_rows.remove(current_row)
 
             if selected_rows:
-                # 첫 번째 선택된 행의 체크박스 상태를 기준으로 설정
+                # 첫 번째 선택된 행의 체크박스 반대 상태로 모든 선택된 행을 설정
                 first_row = min(selected_rows)
-                first_checkbox_widget = self.cellWidget(first_row, 1)
-                if first_checkbox_widget:
-                    first_checkbox = first_checkbox_widget.findChild(QCheckBox)
-                    if first_checkbox:
-                        # 첫 번째 체크박스의 반대 상태로 모든 선택된 행을 설정
-                        new_state = not first_checkbox.isChecked()
-
-                        # 이벤트 연결을 임시로 해제하고 일괄 업데이트
-                        self.batch_update_checkboxes(selected_rows, new_state)
+                new_state = not self.model().is_checked(first_row)
+
+                self.model().set_checked(selected_rows, new_state)
+                self.checkboxes_toggled.emit(sorted(selected_rows), new_state)
             return
         elif event.key() == Qt.Key_C and event.modifiers() == Qt.ControlModifier:
             # Ctrl+C 처리: 선택된 모든 행의 패키지 이름 복사
@@ -785,17 +1607,14 @@ class CheckBoxTableWidget(QTableWidget):
                 selected_rows.add(index.row())
 
             # 현재 포커스된 행도 포함
-            current_row = self.currentRow()
+            current_row = self.currentIndex().row()
             if current_row >= 0:
                 selected_rows.add(current_row)
 
             if selected_rows:
-                # 선택된 모든 행의 패키지 이름 수집
-                package_names = []
-                for row in sorted(selected_rows):
-                    package_name_item = self.item(row, 2)  # Package Name 컬럼
-                    if package_name_item:
-                        package_names.append(package_name_item.text())
+                # 선택된 모든 행의 패키지 이름 수집 (Package Name 컬럼)
+                model = self.model()
+                package_names = [model.index(row, 2).data() for row in sorted(selected_rows)]
 
                 if package_names:
                     # 패키지 이름들을 \n으로 구분하여 클립보드에 복사
@@ -810,94 +1629,36 @@ class CheckBoxTableWidget(QTableWidget):
 
         super().keyPressEvent(event)
 
-    def batch_update_checkboxes(self, row_indices, new_state):
-        """여러 체크박스를 일괄 업데이트하는 최적화된 메서드"""
-        # 부모 위젯에서 일괄 업데이트 시작 알림
-        parent_widget = self.parent()
-        while parent_widget:
-            if hasattr(parent_widget, 'start_batch_update'):
-                parent_widget.start_batch_update()
-                break
-            parent_widget = parent_widget.parent()
-
-        try:
-            # 체크박스 상태를 빠르게 업데이트
-            for row in row_indices:
-                checkbox_widget = self.cellWidget(row, 1)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        # 이벤트 차단하고 상태만 변경
-                        checkbox.blockSignals(True)
-                        checkbox.setChecked(new_state)
-                        checkbox.blockSignals(False)
-
-        finally:
-            # 일괄 업데이트 완료 알림
-            parent_widget = self.parent()
-            while parent_widget:
-                if hasattr(parent_widget, 'end_batch_update'):
-                    parent_widget.end_batch_update(row_indices, new_state)
-                    break
-                parent_widget = parent_widget.parent()
-
-    def sort(self, column, order):
-        """정렬 - Package Name 컬럼(2)만 허용하고 패키지 이름으로만 정렬"""
-        if column == 2:  # Package Name 컬럼만 정렬 허용
-            # 현재 아이템들을 가져와서 패키지 이름으로 정렬
-            items = []
-            for row in range(self.rowCount()):
-                # 각 행의 데이터를 보존
-                row_data = {
-                    'index': self.item(row, 0).text() if self.item(row, 0) else "",
-                    'checkbox': self.cellWidget(row, 1),
-                    'package_name': self.item(row, 2).text() if self.item(row, 2) else "",
-                    'is_system': self.item(row, 2).foreground().color() == QColor('gray') if self.item(row, 2) else False
-                }
-                items.append(row_data)
-
-            # 패키지 이름으로만 정렬
-            reverse_order = (order == Qt.DescendingOrder)
-            items.sort(key=lambda x: x['package_name'], reverse=reverse_order)
-
-            # 정렬된 데이터로 테이블 업데이트
-            for row, item_data in enumerate(items):
-                # Index 업데이트 (새 순서로)
-                index_item = QTableWidgetItem(str(row + 1))
-                index_item.setFlags(index_item.flags() & ~Qt.ItemIsEditable)
-                index_item.setTextAlignment(Qt.AlignCenter)
-                self.setItem(row, 0, index_item)
-
-                # 체크박스는 기존 것을 그대로 사용
-                self.setCellWidget(row, 1, item_data['checkbox'])
-
-                # Package Name
-                name_item = QTableWidgetItem(item_data['package_name'])
-                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-                if item_data['is_system']:
-                    name_item.setForeground(QColor('gray'))
-                else:
-                    name_item.setForeground(QColor('black'))
-                name_item.setBackground(QColor(255, 255, 255))
-                self.setItem(row, 2, name_item)
-
 
 class PackageListWidget(QWidget):
     """패키지 목록을 표시하는 위젯"""
+    # 검색어에 이 문자들이 없으면 정규표현식 대신 단순 문자열 비교로 검색
+    _REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
+    # 체크박스로 활성화할 때 한 번의 셸 왕복으로 보내는 패키지 수
+    ENABLE_BATCH_SIZE = 100
+    # 현재 행 주변에서 dumpsys 를 미리 받아 둘 범위 (앞쪽 행 수, 뒤쪽 행 수)
+    PREFETCH_BEFORE = 1
+    PREFETCH_AFTER = 2
 
     def __init__(self):
         super().__init__()
         self.packages = []
         self.filtered_packages = []
         self.search_results = []
+        self.search_pattern = None
+        # 마지막 단순 문자열 검색어 (이어 친 검색어는 이전 결과 행만 다시 검사)
+        self._search_needle = None
+        # 행 순서대로의 소문자 패키지 이름 (검색할 때 만들고 행 순서가 바뀌면 버림)
+        self._name_cache = None
+        # 패키지 이름 -> 행 번호 (선택 복원할 때 만들고 행 순서가 바뀌면 버림)
+        self._row_by_name = None
         self.current_search_index = -1
         self.current_device_id = None
-        # 성능 향상을 위한 패키지 딕셔너리 (이름을 키로 사용)
-        self.package_dict = {}
-        # 일괄 업데이트 상태
-        self.is_batch_updating = False
         # 진행 상황 다이얼로그
         self.progress_dialog = None
+        self.failure_dialog = None
+        # 현재 패키지 목록을 읽는 워커
+        self.worker = None
         self.operation_worker = None
         # 스크롤바 위치 및 선택된 항목 저장
         self.saved_scroll_position = 0
@@ -924,6 +1685,13 @@ class PackageListWidget(QWidget):
 
         self.search_edit.returnPressed.connect(self.search_packages)
 
+        # 입력이 잠시 멈추면 검색 결과 갯수/하이라이트 갱신 (빠르게 입력하는 동안의 변경은 한 번으로 합침)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.update_live_search)
+        self.search_edit.textChanged.connect(lambda: self._search_timer.start())
+
         search_layout.addWidget(QLabel("검색:"))
         search_layout.addWidget(self.search_edit)
         search_layout.addWidget(self.search_button)
@@ -937,10 +1705,20 @@ class PackageListWidget(QWidget):
         self.package_count_label.setFont(g_FONT_10_bold_ref)
         layout.addWidget(self.package_count_label)
 
-        # 패키지 테이블 (체크박스 테이블 사용) - 인덱스 컬럼 추가
-        self.package_table = CheckBoxTableWidget()
-        self.package_table.setColumnCount(3)  # index, checkbox, package name
-        self.package_table.setHorizontalHeaderLabels(["Index", "선택", "Package Name"])
+        # 패키지 테이블 (모델/뷰) - index, checkbox, package name 컬럼
+        self.package_model = PackageTableModel(self)
+        self.package_model.check_state_changed.connect(self.on_checkbox_changed)
+        self.package_table = CheckBoxTableView()
+        self.package_table.setModel(self.package_model)
+        # 체크박스는 셀마다 위젯을 두지 않고 델리게이트가 가운데에 그림
+        self.package_table.setItemDelegateForColumn(1, CheckBoxDelegate(self.package_table))
+
+        # 현재 행이 잠시 머무르면 주변 패키지의 dumpsys 를 미리 받아 더블클릭 시 바로 표시
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(300)
+        self._prefetch_timer.timeout.connect(self.prefetch_adjacent_dumpsys)
+        self.package_table.selectionModel().currentRowChanged.connect(lambda: self._prefetch_timer.start())
 
         # Package Name 컬럼만 정렬 가능하도록 설정
         header = self.package_table.horizontalHeader()
@@ -948,16 +1726,22 @@ class PackageListWidget(QWidget):
         header.setSectionResizeMode(1, QHeaderView.Interactive)  # 체크박스 컬럼
         header.setSectionResizeMode(2, QHeaderView.Interactive)  # Package Name 컬럼
         header.setSortIndicatorShown(True)  # 정렬 표시 활성화
+        header.setSortIndicator(2, Qt.AscendingOrder)
+        # 헤더 클릭 시 PackageTableModel.sort 가 행 데이터를 정렬
+        self.package_table.setSortingEnabled(True)
         # 수정된 부분: 메서드 존재 여부를 확인하고 연결
         if hasattr(self, 'on_sort_indicator_changed'):
             header.sortIndicatorChanged.connect(self.on_sort_indicator_changed)
-        self.package_table.setSortingEnabled(True)
 
         # 마우스 이벤트 연결 (더블클릭)
-        self.package_table.itemDoubleClicked.connect(self.on_package_double_clicked)
+        self.package_table.doubleClicked.connect(self.on_package_double_clicked)
+
+        # Space 키 일괄 체크 시 활성화 명령을 한 번에 실행
+        self.package_table.checkboxes_toggled.connect(self.apply_bulk_state_change)
 
-        # 마우스 우클릭 더블클릭 이벤트 처리를 위한 이벤트 필터
-        self.package_table.viewport().installEventFilter(self)
+        # 마우스 우클릭 더블클릭 이벤트 처리를 위한 이벤트 필터 (이벤트마다 viewport() 를 호출하지 않도록 보관)
+        self._table_viewport = self.package_table.viewport()
+        self._table_viewport.installEventFilter(self)
 
         # 스크롤바 항상 표시
         self.package_table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
@@ -965,20 +1749,20 @@ class PackageListWidget(QWidget):
 
         # 테이블 스타일 설정
         self.package_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #f8f9fa;
                 color: black;
                 gridline-color: #dee2e6;
                 selection-background-color: #add8e6;
                 selection-color: black;
             }
-            QTableWidget::item {
+            QTableView::item {
                 background-color: #ffffff;
                 color: black;
                 border-bottom: 1px solid #dee2e6;
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #add8e6;
                 color: black;
             }
@@ -996,6 +1780,8 @@ class PackageListWidget(QWidget):
         self.package_table.setSelectionMode(QAbstractItemView.ExtendedSelection)  # 다중 선택 허용
         self.package_table.setAlternatingRowColors(True)
         self.package_table.verticalHeader().setVisible(False)
+        # 패키지 이름은 한 줄이므로 행 높이를 고정해 행 수만큼의 높이 계산을 하지 않음
+        self.package_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
 
         # 포커스 정책 설정
         self.package_table.setFocusPolicy(Qt.StrongFocus)
@@ -1090,6 +1876,11 @@ class PackageListWidget(QWidget):
         self.reset_button.clicked.connect(self.reset_selected)
         button_layout.addWidget(self.reset_button)
 
+        # Refresh 버튼 (디바이스에서 패키지 목록을 다시 읽음)
+        self.refresh_button = QPushButton("Refresh")
+        self.refresh_button.clicked.connect(self.refresh_packages)
+        button_layout.addWidget(self.refresh_button)
+
         button_layout.addStretch()
 
         layout.addLayout(button_layout)
@@ -1103,10 +1894,16 @@ class PackageListWidget(QWidget):
 
     def on_sort_indicator_changed(self, logical_index, order):
         """정렬 표시기 변경 시 호출 - Package Name 컬럼만 허용"""
+        self._name_cache = None
+        self._row_by_name = None
         if logical_index != 2:  # Package Name 컬럼(2)이 아니면
             # Package Name 컬럼으로 정렬 변경
             header = self.package_table.horizontalHeader()
             header.setSortIndicator(2, Qt.AscendingOrder)
+        elif self.search_pattern is not None:
+            # 정렬로 행 순서가 바뀌었으므로 이전 결과를 버리고 검색 결과를 다시 계산
+            self._search_needle = None
+            self.update_search_results(self.search_pattern)
 
     def save_scroll_position(self):
         """현재 스크롤바 위치를 저장"""
@@ -1115,32 +1912,20 @@ class PackageListWidget(QWidget):
 
     def restore_scroll_position(self):
         """저장된 스크롤바 위치로 복원"""
+        # 모델이 방금 리셋되었어도 스크롤 범위가 새 행 수에 맞도록 레이아웃을 바로 갱신
+        self.package_table.doItemsLayout()
         scroll_bar = self.package_table.verticalScrollBar()
         scroll_bar.setValue(self.saved_scroll_position)
 
     def save_selected_items(self):
         """현재 선택된 항목들과 포커스 행을 저장"""
         # 현재 선택된 패키지 이름들 저장
-        self.saved_selected_packages = []
-        selected_indexes = self.package_table.selectionModel().selectedIndexes()
-        selected_rows = set()
-
-        for index in selected_indexes:
-            selected_rows.add(index.row())
-
-        for row in selected_rows:
-            package_name_item = self.package_table.item(row, 2)
-            if package_name_item:
-                self.saved_selected_packages.append(package_name_item.text())
+        self.saved_selected_packages = [self.filtered_packages[row].name for row in self.get_selected_rows()]
 
         # 현재 포커스된 행의 패키지 이름 저장
-        current_row = self.package_table.currentRow()
+        current_row = self.package_table.currentIndex().row()
         if current_row >= 0:
-            package_name_item = self.package_table.item(current_row, 2)
-            if package_name_item:
-                self.saved_current_row = package_name_item.text()
-            else:
-                self.saved_current_row = None
+            self.saved_current_row = self.filtered_packages[current_row].name
         else:
             self.saved_current_row = None
 
@@ -1149,26 +1934,29 @@ class PackageListWidget(QWidget):
         if not self.saved_selected_packages and self.saved_current_row is None:
             return
 
-        # 패키지 이름으로 행 찾기를 위한 딕셔너리 생성
-        package_to_row = {}
-        for row in range(self.package_table.rowCount()):
-            package_name_item = self.package_table.item(row, 2)
-            if package_name_item:
-                package_to_row[package_name_item.text()] = row
-
-        # 선택 상태를 클리어하고 새로 설정
-        self.package_table.clearSelection()
-
-        # 저장된 선택 항목들을 복원
-        for package_name in self.saved_selected_packages:
-            if package_name in package_to_row:
-                row = package_to_row[package_name]
-                self.package_table.selectRow(row)
-
-        # 저장된 포커스 행을 복원
+        # 패키지 이름으로 행 찾기 (행 순서가 바뀌기 전까지 재사용)
+        if self._row_by_name is None:
+            self._row_by_name = {package.name: row for row, package in enumerate(self.filtered_packages)}
+        package_to_row = self._row_by_name
+
+        # 저장된 선택 항목들을 연속된 행 범위로 묶어 한 번에 선택 (selectRow 는 이전 선택을 지움)
+        rows = sorted(package_to_row[package_name] for package_name in self.saved_selected_packages
+                      if package_name in package_to_row)
+        selection = QItemSelection()
+        last_column = self.package_model.columnCount() - 1
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                selection.select(self.package_model.index(rows[start], 0),
+                                 self.package_model.index(rows[i - 1], last_column))
+                start = i
+        selection_model = self.package_table.selectionModel()
+        selection_model.select(selection, QItemSelectionModel.ClearAndSelect)
+
+        # 저장된 포커스 행을 복원 (선택은 바꾸지 않음)
         if self.saved_current_row and self.saved_current_row in package_to_row:
             row = package_to_row[self.saved_current_row]
-            self.package_table.setCurrentCell(row, 2)
+            selection_model.setCurrentIndex(self.package_model.index(row, 2), QItemSelectionModel.NoUpdate)
 
     def check_on_selected(self):
         """선택된 패키지들의 체크박스를 모두 CheckOn"""
@@ -1195,146 +1983,87 @@ class PackageListWidget(QWidget):
             QMessageBox.information(self, "알림", "토글할 패키지를 선택해주세요.")
             return
 
-        # 첫 번째 선택된 행의 체크박스 상태를 기준으로 토글
+        # 첫 번째 선택된 행의 체크박스 반대 상태로 모든 선택된 행을 설정
         first_row = min(selected_rows)
-        first_checkbox_widget = self.package_table.cellWidget(first_row, 1)
-        if first_checkbox_widget:
-            first_checkbox = first_checkbox_widget.findChild(QCheckBox)
-            if first_checkbox:
-                # 첫 번째 체크박스의 반대 상태로 모든 선택된 행을 설정
-                new_state = not first_checkbox.isChecked()
-                self.batch_update_selected_checkboxes(selected_rows, new_state)
+        new_state = not self.package_model.is_checked(first_row)
+        self.batch_update_selected_checkboxes(selected_rows, new_state)
 
     def get_selected_rows(self):
         """선택된 행들의 인덱스 리스트 반환"""
+        # 셀마다 인덱스를 만들지 않고 선택 범위(행 구간)만 펼침 (Ctrl 선택으로 구간이 겹칠 수 있어 set 사용)
         selected_rows = set()
-        selected_indexes = self.package_table.selectionModel().selectedIndexes()
-        for index in selected_indexes:
-            selected_rows.add(index.row())
-        return sorted(list(selected_rows))
+        for selection_range in self.package_table.selectionModel().selection():
+            selected_rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        return sorted(selected_rows)
 
     def batch_update_selected_checkboxes(self, row_indices, new_state):
         """선택된 행들의 체크박스를 일괄 업데이트"""
-        self.start_batch_update()
-        try:
-            for row in row_indices:
-                checkbox_widget = self.package_table.cellWidget(row, 1)
-                if checkbox_widget:
-                    checkbox = checkbox_widget.findChild(QCheckBox)
-                    if checkbox:
-                        checkbox.blockSignals(True)
-                        checkbox.setChecked(new_state)
-                        checkbox.blockSignals(False)
-        finally:
-            self.end_batch_update(row_indices, new_state)
-
-    def start_batch_update(self):
-        """일괄 업데이트 시작"""
-        self.is_batch_updating = True
-
-    def end_batch_update(self, row_indices, new_state):
-        """일괄 업데이트 완료 - 패키지 데이터 업데이트"""
-        try:
-            # 효율적으로 패키지 데이터 업데이트
-            for row in row_indices:
-                package_name_item = self.package_table.item(row, 2)
-                if package_name_item:
-                    package_name = package_name_item.text()
-                    # 딕셔너리를 사용한 빠른 검색
-                    if package_name in self.package_dict:
-                        self.package_dict[package_name]['selected'] = new_state
-        finally:
-            self.is_batch_updating = False
-
-    def on_checkbox_changed(self, state):
-        """개별 체크박스 상태 변경 - 최적화됨"""
-        # 일괄 업데이트 중이면 개별 처리 건너뛰기
-        if self.is_batch_updating:
-            return
+        self.package_model.set_checked(row_indices, new_state)
 
-        checkbox = self.sender()
-        row = -1
+    def on_checkbox_changed(self, row, checked):
+        """개별 체크박스 클릭 - 체크 상태는 모델에 이미 반영됨"""
+        # 체크하면 패키지 활성화 (filtered_packages 는 표시 순서와 같음)
+        if checked and self.current_device_id:
+            self.enable_packages([self.filtered_packages[row].name])
 
-        # 체크박스가 위치한 행 찾기
-        for i in range(self.package_table.rowCount()):
-            checkbox_widget = self.package_table.cellWidget(i, 1)
-            if checkbox_widget and checkbox_widget.findChild(QCheckBox) == checkbox:
-                row = i
-                break
-
-        if row != -1:
-            # 패키지 데이터 업데이트
-            package_name_item = self.package_table.item(row, 2)
-            if package_name_item:
-                package_name = package_name_item.text()
-                # 딕셔너리를 사용한 빠른 업데이트
-                if package_name in self.package_dict:
-                    package = self.package_dict[package_name]
-                    package['selected'] = (state == Qt.Checked)
-
-                    # 체크박스 상태에 따라 작업 수행
-                    if state == Qt.Checked:
-                        self.install_or_enable_package(package_name, package['is_system'])
-
-    def install_or_enable_package(self, package_name, is_system):
-        """패키지 설치 또는 활성화"""
-        if not self.current_device_id:
+    def apply_bulk_state_change(self, row_indices, new_state):
+        """여러 체크박스를 한 번에 체크했을 때 개별 체크와 같이 패키지 활성화"""
+        if not new_state or not self.current_device_id:
             return
 
-        try:
-            if is_system:
-                # 시스템 앱은 활성화
-                cmd = f"adb -s {self.current_device_id} shell pm enable {package_name}"
-            else:
-                # 일반 앱은 설치 (이미 설치된 경우 활성화)
-                cmd = f"adb -s {self.current_device_id} shell pm enable {package_name}"
+        package_names = [self.filtered_packages[row].name for row in row_indices]
+        self.enable_packages(package_names)
 
-            subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=30)
-        except Exception as e:
-            print(f"패키지 활성화 실패: {package_name}, 오류: {str(e)}")
+    def enable_packages(self, package_names):
+        """여러 패키지를 묶음마다 adb shell 명령 한 번으로 활성화 (공용 스레드 풀에서 실행)"""
+        device_id = self.current_device_id
+        # 셸 명령 한 줄이 너무 길어지지 않도록 묶음 크기 제한
+        batch_size = self.ENABLE_BATCH_SIZE
+        commands = ["; ".join(f"pm enable {shlex.quote(name)}" for name in package_names[start:start + batch_size])
+                    for start in range(0, len(package_names), batch_size)]
+
+        def run():
+            try:
+                session = AdbShell.get(device_id)
+                for command in commands:
+                    session.run(command)
+                invalidate_package_cache(device_id, package_names)
+            except Exception as e:
+                print(f"패키지 활성화 실패: {len(package_names)}개, 오류: {str(e)}")
+
+        _ADB_POOL.start(AdbTask(run))
 
     def eventFilter(self, obj, event):
         """이벤트 필터 - 마우스 우클릭 더블클릭 감지"""
-        if obj == self.package_table.viewport():
-            if event.type() == QEvent.MouseButtonDblClick:
-                if event.button() == Qt.RightButton:
-                    item = self.package_table.itemAt(event.pos())
-                    if item:
-                        self.on_package_right_double_clicked(item)
-                    return True
+        # 자주 오는 다른 이벤트(마우스 이동, 페인트 등)는 타입 비교만 하고 바로 넘김
+        if event.type() == QEvent.MouseButtonDblClick and obj is self._table_viewport:
+            if event.button() == Qt.RightButton:
+                index = self.package_table.indexAt(event.pos())
+                if index.isValid():
+                    self.on_package_right_double_clicked(index)
+                return True
         return super().eventFilter(obj, event)
 
-    def on_package_double_clicked(self, item):
+    def on_package_double_clicked(self, index):
         """패키지 더블클릭 이벤트 (왼쪽 버튼)"""
-        if not self.current_device_id:
-            QMessageBox.warning(self, "경고", "선택된 디바이스가 없습니다.")
-            return
+        self.open_package_dialog(index, PackageInfoDialog)
 
-        if item.column() <= 1:  # Index나 체크박스 컬럼이면 무시
-            return
-
-        row = item.row()
-        package_name_item = self.package_table.item(row, 2)  # Package Name 컬럼
-        if package_name_item:
-            package_name = package_name_item.text()
-            dialog = PackageInfoDialog(self.current_device_id, package_name, self)
-            dialog.exec_()
-
-    def on_package_right_double_clicked(self, item):
+    def on_package_right_double_clicked(self, index):
         """패키지 마우스 우클릭 더블클릭 이벤트"""
+        self.open_package_dialog(index, PackageDetailDialog)
+
+    def open_package_dialog(self, index, dialog_class):
+        """더블클릭한 행의 패키지로 정보 다이얼로그 열기"""
         if not self.current_device_id:
             QMessageBox.warning(self, "경고", "선택된 디바이스가 없습니다.")
             return
 
-        if item.column() <= 1:  # Index나 체크박스 컬럼이면 무시
+        if index.column() <= 1:  # Index나 체크박스 컬럼이면 무시
             return
 
-        row = item.row()
-        package_name_item = self.package_table.item(row, 2)  # Package Name 컬럼
-        if package_name_item:
-            package_name = package_name_item.text()
-            dialog = PackageDetailDialog(self.current_device_id, package_name, self)
-            dialog.exec_()
+        package_name = self.filtered_packages[index.row()].name
+        dialog = dialog_class(self.current_device_id, package_name, self)
+        dialog.exec_()
 
     def keyPressEvent(self, event):
         """키보드 이벤트 처리"""
@@ -1363,63 +2092,93 @@ class PackageListWidget(QWidget):
     def reset_search(self):
         """검색 리셋"""
         self.search_edit.clear()
+        self.clear_search_results()
+
+    def clear_search_results(self):
+        """검색 결과, 갯수 표시, 하이라이트 제거"""
         self.search_result_label.setText("")
         self.clear_search_highlights()
         self.search_results = []
+        self.search_pattern = None
+        self._search_needle = None
         self.current_search_index = -1
 
+    def update_live_search(self):
+        """입력 중인 검색어로 결과 갯수/하이라이트만 갱신 (포커스와 현재 행은 그대로)"""
+        search_text = self.search_edit.text().strip()
+        if not search_text:
+            self.clear_search_results()
+            return
+
+        try:
+            pattern = compile_search_pattern(search_text)
+        except re.error:
+            # 입력 중인 미완성 정규표현식은 무시 (검색 실행 시 오류 표시)
+            return
+
+        self.update_search_results(pattern)
+
     def search_packages(self):
         """패키지 검색"""
+        self._search_timer.stop()
         search_text = self.search_edit.text().strip()
         if not search_text:
             QMessageBox.warning(self, "경고", "검색할 문자를 입력해주세요.")
             return
 
         try:
-            pattern = re.compile(search_text, re.IGNORECASE)
-            self.search_results = []
-
-            # 먼저 모든 하이라이트 제거
-            self.clear_search_highlights()
-
-            for row in range(self.package_table.rowCount()):
-                package_name_item = self.package_table.item(row, 2)  # Package Name 컬럼
-                if package_name_item and pattern.search(package_name_item.text()):
-                    self.search_results.append(row)
+            pattern = compile_search_pattern(search_text)
+        except re.error as e:
+            QMessageBox.warning(self, "정규표현식 오류", f"잘못된 정규표현식입니다: {str(e)}")
+            return
 
-            # 검색 결과 갯수 표시
-            self.search_result_label.setText(f"검색[{len(self.search_results)}]")
+        self.update_search_results(pattern)
 
-            # 검색 결과 하이라이트
-            self.highlight_search_results()
+        # 패키지 테이블로 포커스 이동
+        self.package_table.setFocus()
 
-            # 패키지 테이블로 포커스 이동
-            self.package_table.setFocus()
+        # 첫 번째 검색 결과로 이동
+        self.current_search_index = -1
+        if self.search_results:
+            self.find_next()
+
+    def update_search_results(self, pattern):
+        """검색 결과 행 목록, 갯수 표시, 하이라이트 갱신"""
+        self.search_pattern = pattern
+
+        # 행 순서와 같은 소문자 이름 목록에서 바로 검사 (테이블/행 객체를 거치지 않음)
+        if self._name_cache is None:
+            self._name_cache = [package.name.lower() for package in self.filtered_packages]
+        names = self._name_cache
+
+        if not any(c in self._REGEX_METACHARS for c in pattern.pattern):
+            # 정규표현식 특수문자가 없으면 대소문자 무시 부분 문자열 비교로 충분
+            needle = pattern.pattern.lower()
+            if self._search_needle is not None and self._search_needle in needle:
+                # 이전 검색어를 포함하는 검색어는 이전 결과 행 중에서만 찾으면 됨
+                self.search_results = [row for row in self.search_results if needle in names[row]]
+            else:
+                self.search_results = [row for row, name in enumerate(names) if needle in name]
+            self._search_needle = needle
+        else:
+            # 패턴은 대소문자를 무시하므로 소문자 이름에 그대로 적용
+            self._search_needle = None
+            search = pattern.search
+            self.search_results = [row for row, name in enumerate(names) if search(name)]
 
-            # 첫 번째 검색 결과로 이동
-            self.current_search_index = -1
-            if self.search_results:
-                self.find_next()
+        # 검색 결과 갯수 표시
+        self.search_result_label.setText(f"검색[{len(self.search_results)}]")
 
-        except re.error as e:
-            QMessageBox.warning(self, "정규표현식 오류", f"잘못된 정규표현식입니다: {str(e)}")
+        # 검색 결과 하이라이트
+        self.highlight_search_results()
 
     def highlight_search_results(self):
-        """검색 결과 하이라이트 - Package Name 컬럼을 노란색 배경"""
-        for row in self.search_results:
-            # Package Name 컬럼만 연한 노란색 배경으로 변경
-            name_item = self.package_table.item(row, 2)
-            if name_item:
-                name_item.setBackground(QColor(255, 255, 224))  # 연한 노란색
+        """검색 결과 하이라이트 - Package Name 컬럼을 노란색 배경 (이전 하이라이트는 대체됨)"""
+        self.package_model.set_highlight_rows(self.search_results)
 
     def clear_search_highlights(self):
         """검색 하이라이트 제거"""
-        for row in range(self.package_table.rowCount()):
-            # Package Name 컬럼의 배경색 초기화
-            name_item = self.package_table.item(row, 2)
-            if name_item:
-                # 원래 배경색으로 복원
-                name_item.setBackground(QColor(255, 255, 255))  # 흰색 배경
+        self.package_model.set_highlight_rows(())
 
     def find_next(self):
         """다음 검색 결과로 이동 - 경계값 확인 후 이동"""
@@ -1427,27 +2186,19 @@ class PackageListWidget(QWidget):
             return
 
         # 현재 포커스된 행 가져오기
-        current_row = self.package_table.currentRow()
-
-        # 현재 포커스 행보다 큰 검색 결과 중 가장 가까운 것 찾기
-        next_rows = [row for row in self.search_results if row > current_row]
+        current_row = self.package_table.currentIndex().row()
 
-        if next_rows:
-            # 가장 가까운 다음 결과로 이동
-            next_row = min(next_rows)
-            self.current_search_index = self.search_results.index(next_row)
-        else:
+        # 현재 포커스 행보다 큰 검색 결과 중 가장 가까운 것 찾기 (search_results 는 오름차순)
+        index = bisect.bisect_right(self.search_results, current_row)
+        if index >= len(self.search_results):
             # 현재 포커스가 마지막 검색 결과보다 크거나 같으면 현재 위치 유지
-            max_search_row = max(self.search_results) if self.search_results else -1
-            if current_row >= max_search_row:
-                return  # 현재 위치에 머물기
-            else:
-                # 첫 번째 검색 결과로 순환
-                next_row = self.search_results[0]
-                self.current_search_index = 0
+            return
+
+        next_row = self.search_results[index]
+        self.current_search_index = index
 
         self.package_table.selectRow(next_row)
-        self.package_table.scrollToItem(self.package_table.item(next_row, 2))
+        self.package_table.scrollTo(self.package_model.index(next_row, 2))
 
     def find_previous(self):
         """이전 검색 결과로 이동 - 경계값 확인 후 이동"""
@@ -1455,36 +2206,40 @@ class PackageListWidget(QWidget):
             return
 
         # 현재 포커스된 행 가져오기
-        current_row = self.package_table.currentRow()
-
-        # 현재 포커스 행보다 작은 검색 결과 중 가장 가까운 것 찾기
-        prev_rows = [row for row in self.search_results if row < current_row]
+        current_row = self.package_table.currentIndex().row()
 
-        if prev_rows:
-            # 가장 가까운 이전 결과로 이동
-            prev_row = max(prev_rows)
-            self.current_search_index = self.search_results.index(prev_row)
-        else:
+        # 현재 포커스 행보다 작은 검색 결과 중 가장 가까운 것 찾기 (search_results 는 오름차순)
+        index = bisect.bisect_left(self.search_results, current_row) - 1
+        if index < 0:
             # 현재 포커스가 첫 번째 검색 결과보다 작거나 같으면 현재 위치 유지
-            min_search_row = min(self.search_results) if self.search_results else float('inf')
-            if current_row <= min_search_row:
-                return  # 현재 위치에 머물기
-            else:
-                # 마지막 검색 결과로 순환
-                prev_row = self.search_results[-1]
-                self.current_search_index = len(self.search_results) - 1
+            return
+
+        prev_row = self.search_results[index]
+        self.current_search_index = index
 
         self.package_table.selectRow(prev_row)
-        self.package_table.scrollToItem(self.package_table.item(prev_row, 2))
+        self.package_table.scrollTo(self.package_model.index(prev_row, 2))
 
-    def load_packages(self, device_id):
-        """패키지 목록 로드"""
+    def load_packages(self, device_id, use_cache=True):
+        """패키지 목록 로드 (use_cache=False 면 캐시된 목록을 무시하고 디바이스에서 다시 읽음)"""
         self.current_device_id = device_id
         self.clear_packages()
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
 
-        self.worker = PackageWorker(device_id)
+        # 이전 디바이스를 읽던 워커의 결과가 새 디바이스 목록을 덮어쓰지 않도록 연결 해제
+        if self.worker is not None:
+            try:
+                self.worker.package_loaded.disconnect(self.on_packages_loaded)
+                self.worker.progress_updated.disconnect(self.progress_bar.setValue)
+                self.worker.error_occurred.disconnect(self.on_error)
+            except (RuntimeError, TypeError):
+                # 이미 끝나서 삭제된 워커
+                pass
+
+        # 목록 표시 후에도 상세 정보를 미리 받는 중일 수 있으므로 부모에 맡기고 끝나면 삭제
+        self.worker = PackageWorker(device_id, self, use_cache)
+        self.worker.finished.connect(self.worker.deleteLater)
         self.worker.package_loaded.connect(self.on_packages_loaded)
         self.worker.progress_updated.connect(self.progress_bar.setValue)
         self.worker.error_occurred.connect(self.on_error)
@@ -1493,87 +2248,42 @@ class PackageListWidget(QWidget):
     @pyqtSlot(list)
     def on_packages_loaded(self, packages):
         """패키지 로드 완료 - 최적화됨"""
+        # 연결 해제 전에 이미 이벤트 큐에 들어간 이전 워커의 결과는 무시
+        if self.sender() is not self.worker:
+            return
         self.packages = packages
         self.filtered_packages = packages.copy()
 
-        # 패키지 딕셔너리 생성 (빠른 검색을 위해)
-        self.package_dict = {pkg['name']: pkg for pkg in packages}
-
         self.display_packages()
         self.progress_bar.setVisible(False)
 
-        # 패키지 목록 로드 후 선택된 항목들 복원
-        QTimer.singleShot(100, self.restore_selected_items)
+        # 패키지 목록 로드 후 선택된 항목들 복원 (모델 리셋이 끝났으므로 바로 적용)
+        self.restore_selected_items()
 
     @pyqtSlot(str)
     def on_error(self, error_message):
         """오류 처리"""
+        if self.sender() is not self.worker:
+            return
         QMessageBox.critical(self, "오류", error_message)
         self.progress_bar.setVisible(False)
 
     def display_packages(self):
-        """패키지 목록 표시 - 최적화됨"""
-        self.package_table.setRowCount(len(self.filtered_packages))
+        """패키지 목록 표시 - 모델의 행 데이터만 교체 (보이는 행만 그려짐)"""
+        # 현재 정렬 방향대로 행 데이터를 정렬한 뒤 표시
+        header = self.package_table.horizontalHeader()
+        self.filtered_packages.sort(key=attrgetter('name'),
+                                    reverse=(header.sortIndicatorOrder() == Qt.DescendingOrder))
+        self.package_model.set_rows(self.filtered_packages)
+        self._name_cache = None
+        self._row_by_name = None
 
         # 전체 패키지 갯수 표시 업데이트
         self.package_count_label.setText(f"전체 package 갯수 [{len(self.filtered_packages)}]")
 
-        # 업데이트 시작을 알림
-        self.package_table.setUpdatesEnabled(False)  # UI 업데이트 임시 중단
-
-        try:
-            for row, package in enumerate(self.filtered_packages):
-                # Index 컬럼 (정렬 불가)
-                index_item = QTableWidgetItem(str(row + 1))
-                index_item.setFlags(index_item.flags() & ~Qt.ItemIsEditable)
-                index_item.setTextAlignment(Qt.AlignCenter)
-                self.package_table.setItem(row, 0, index_item)
-
-                # 체크박스
-                checkbox = QCheckBox()
-                checkbox.setChecked(package.get('selected', False))
-                checkbox.stateChanged.connect(self.on_checkbox_changed)
-                # 시스템 앱은 회색으로 표시
-                if package['is_system']:
-                    checkbox.setStyleSheet("color: gray;")
-
-                # 체크박스를 가운데 정렬
-                checkbox_widget = QWidget()
-                checkbox_layout = QHBoxLayout(checkbox_widget)
-                checkbox_layout.addWidget(checkbox)
-                checkbox_layout.setAlignment(Qt.AlignCenter)
-                checkbox_layout.setContentsMargins(0, 0, 0, 0)
-
-                self.package_table.setCellWidget(row, 1, checkbox_widget)
-
-                # Package Name
-                name_item = QTableWidgetItem(package['name'])
-                name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-                if package['is_system']:
-                    name_item.setForeground(QColor('gray'))
-                else:
-                    name_item.setForeground(QColor('black'))
-                # 배경색을 명시적으로 설정
-                name_item.setBackground(QColor(255, 255, 255))  # 흰색 배경
-                self.package_table.setItem(row, 2, name_item)
-
-        finally:
-            self.package_table.setUpdatesEnabled(True)  # UI 업데이트 재개
-
     def get_selected_packages(self):
         """선택된 패키지 목록 반환"""
-        selected_packages = []
-
-        for row in range(self.package_table.rowCount()):
-            checkbox_widget = self.package_table.cellWidget(row, 1)
-            if checkbox_widget:
-                checkbox = checkbox_widget.findChild(QCheckBox)
-                if checkbox and checkbox.isChecked():
-                    package_name_item = self.package_table.item(row, 2)
-                    if package_name_item:
-                        selected_packages.append(package_name_item.text())
-
-        return selected_packages
+        return [package.name for package in self.filtered_packages if package.selected]
 
     def uninstall_selected(self):
         """선택된 패키지 삭제"""
@@ -1652,17 +2362,25 @@ class PackageListWidget(QWidget):
             QMessageBox.warning(self, "경고", "선택된 디바이스가 없습니다.")
             return
 
-        # 진행 다이얼로그 생성
-        self.progress_dialog = ProgressDialog(operation, len(packages), self)
+        # 취소한 작업도 현재 묶음을 마칠 때까지 실행되므로 끝나기 전에는 새 작업을 시작하지 않음
+        # (공유하는 진행 다이얼로그와 operation_worker 를 이전 워커가 건드리지 않도록)
+        if self.operation_worker is not None:
+            QMessageBox.warning(self, "경고", "이전 작업을 마무리하는 중입니다. 잠시 후 다시 시도하세요.")
+            return
+
+        # 진행 다이얼로그는 처음 한 번만 만들고 이후 작업에서는 초기화해서 재사용
+        if self.progress_dialog is None:
+            self.progress_dialog = ProgressDialog(operation, len(packages), self)
+            self.progress_dialog.cancel_requested.connect(self.cancel_operation)
+        else:
+            self.progress_dialog.reset(operation, len(packages))
 
         # 워커 스레드 생성
         self.operation_worker = PackageOperationWorker(self.current_device_id, packages, operation)
 
-        # 시그널 연결
-        self.operation_worker.progress_updated.connect(self.progress_dialog.update_progress)
-        self.operation_worker.operation_completed.connect(self.on_operation_completed)
-        self.operation_worker.error_occurred.connect(self.on_operation_error)
-        self.progress_dialog.cancel_requested.connect(self.operation_worker.cancel)
+        # 시그널 연결 (워커 스레드에서 보내는 시그널은 항상 메인 스레드 이벤트 큐를 거쳐 순서대로 처리)
+        self.operation_worker.progress_updated.connect(self.progress_dialog.update_progress, Qt.QueuedConnection)
+        self.operation_worker.operation_completed.connect(self.on_operation_completed, Qt.QueuedConnection)
 
         # 워커 스레드 시작
         self.operation_worker.start()
@@ -1670,9 +2388,27 @@ class PackageListWidget(QWidget):
         # 진행 다이얼로그 표시
         self.progress_dialog.exec_()
 
+    def _show_failures(self, title, message, items):
+        """실패 목록 다이얼로그 표시 (처음 한 번만 만들고 재사용)"""
+        if self.failure_dialog is None:
+            self.failure_dialog = FailureListDialog(self)
+        self.failure_dialog.set_items(title, message, items)
+        self.failure_dialog.exec_()
+
+    def cancel_operation(self):
+        """진행 중인 패키지 작업 취소"""
+        if self.operation_worker:
+            self.operation_worker.cancel()
+
     @pyqtSlot(list)
     def on_operation_completed(self, failed_packages):
         """패키지 작업 완료"""
+        worker = self.sender()
+        if worker is not self.operation_worker:
+            return
+        # 재사용하는 진행 다이얼로그를 끝난 워커가 더 이상 갱신하지 않도록 연결 해제
+        worker.progress_updated.disconnect(self.progress_dialog.update_progress)
+
         operation_names = {
             "uninstall": "삭제",
             "disable": "비활성화",
@@ -1680,49 +2416,112 @@ class PackageListWidget(QWidget):
             "reset": "재설정"
         }
 
-        # 결과 메시지 표시
-        if failed_packages:
-            operation_name = operation_names.get(self.operation_worker.operation, "처리")
-            QMessageBox.warning(self, "경고",
-                                f"다음 패키지 {operation_name}에 실패했습니다:\n" + "\n".join(failed_packages))
-
-        # 패키지 목록 새로고침
-        self.load_packages(self.current_device_id)
-
-        # 작업 완료 후 복원 처리
-        if self.operation_worker.operation == "uninstall":
-            # uninstall의 경우 스크롤 위치만 복원
-            QTimer.singleShot(1000, self.restore_scroll_position)
-        else:
-            # enable/disable/default의 경우 스크롤 위치와 선택 항목 모두 복원
-            QTimer.singleShot(1000, self.restore_scroll_position)
-            # 선택 항목 복원은 패키지 로드 완료 후에 처리됨 (on_packages_loaded에서)
+        # 결과 메시지 표시 (작업 중 발생한 오류는 모아서 한 번만 알림)
+        if worker.transport_error:
+            QMessageBox.critical(self, "오류", f"작업 중 오류가 발생했습니다: {worker.transport_error}")
+        elif failed_packages:
+            operation_name = operation_names.get(worker.operation, "처리")
+            reasons = worker.failure_reasons
+            lines = [f"{package}: {reasons[package]}" if reasons.get(package) else package
+                     for package in failed_packages]
+            self._show_failures("경고", f"다음 패키지 {operation_name}에 실패했습니다: {len(lines)}개", lines)
+
+        # 상태가 바뀐 패키지의 dumpsys 캐시 제거 후 패키지 목록을 다시 읽지 않고 작업 결과만 반영
+        invalidate_package_cache(worker.device_id, worker.packages)
+        # 작업 중에 다른 디바이스로 바꿨으면 현재 목록에는 반영하지 않음
+        if worker.device_id == self.current_device_id:
+            self.apply_operation_result(worker.operation, worker.succeeded_packages)
+            if worker.operation != "uninstall":
+                self.prefetch_package_details(worker.succeeded_packages)
 
         # 정리
         self.operation_worker = None
-        self.progress_dialog = None
 
-    @pyqtSlot(str)
-    def on_operation_error(self, error_message):
-        """패키지 작업 오류"""
-        if self.progress_dialog:
-            self.progress_dialog.accept()
+    def apply_operation_result(self, operation, succeeded_packages):
+        """작업 결과를 현재 패키지 목록에 반영 (삭제된 패키지 제거, 체크 해제)"""
+        if operation == "uninstall":
+            removed = set(succeeded_packages)
+            self.packages = [package for package in self.packages if package.name not in removed]
+            self.filtered_packages = [package for package in self.filtered_packages
+                                      if package.name not in removed]
 
-        QMessageBox.critical(self, "오류", f"작업 중 오류가 발생했습니다: {error_message}")
+        # 새로 읽어 온 목록처럼 체크 상태는 모두 해제
+        for package in self.packages:
+            package.selected = False
 
-        # 정리
-        self.operation_worker = None
-        self.progress_dialog = None
+        self.display_packages()
+
+        # 행이 바뀌었을 수 있으므로 검색 결과 다시 계산
+        if self.search_pattern is not None:
+            self._search_needle = None
+            self.update_search_results(self.search_pattern)
+
+        # 스크롤 위치 복원 (uninstall 외에는 선택 항목도 복원)
+        if operation != "uninstall":
+            self.restore_selected_items()
+        self.restore_scroll_position()
+
+    def prefetch_package_details(self, package_names):
+        """상태가 바뀐 패키지들의 상세 정보를 공용 스레드 풀에서 미리 받아 두기"""
+        if not package_names:
+            return
+        device_id = self.current_device_id
+        package_names = list(package_names)
+
+        def run():
+            try:
+                PackageWorker.fetch_package_details(device_id, package_names)
+            except (subprocess.SubprocessError, OSError):
+                # 실패해도 상세 창에서 개별 조회
+                pass
+
+        _ADB_POOL.start(AdbTask(run))
+
+    def prefetch_adjacent_dumpsys(self):
+        """현재 행 주변 패키지의 dumpsys 출력을 공용 스레드 풀에서 미리 받아 두기"""
+        row = self.package_table.currentIndex().row()
+        device_id = self.current_device_id
+        if row < 0 or not device_id:
+            return
+
+        rows = self.filtered_packages[max(0, row - self.PREFETCH_BEFORE):row + self.PREFETCH_AFTER + 1]
+        package_names = [package.name for package in rows
+                         if _DUMPSYS_CACHE.get((device_id, package.name)) is None]
+        if not package_names:
+            return
+
+        def run():
+            try:
+                PackageWorker.fetch_package_dumpsys(device_id, package_names)
+            except (subprocess.SubprocessError, OSError):
+                # 실패해도 정보 창에서 개별 조회
+                pass
+
+        _ADB_POOL.start(AdbTask(run))
+
+    def refresh_packages(self):
+        """현재 디바이스의 패키지 목록을 다시 로드"""
+        if not self.current_device_id:
+            QMessageBox.warning(self, "경고", "선택된 디바이스가 없습니다.")
+            return
+
+        self.load_packages(self.current_device_id, use_cache=False)
 
     def clear_packages(self):
         """패키지 목록 초기화"""
-        self.package_table.setRowCount(0)
         self.packages = []
         self.filtered_packages = []
-        self.package_dict = {}  # 딕셔너리도 초기화
+        self.package_model.set_rows(self.filtered_packages)
         self.search_results = []
+        self.search_pattern = None
+        self._search_needle = None
+        self._name_cache = None
+        self._row_by_name = None
         self.current_search_index = -1
-        self.search_edit.clear()
+        # 검색 상태는 위에서 초기화했으므로 검색어를 지울 때 실시간 검색이 다시 돌지 않게 함
+        with QSignalBlocker(self.search_edit):
+            self.search_edit.clear()
+        self._search_timer.stop()
         self.search_result_label.setText("")
         self.package_count_label.setText("전체 package 갯수 [0]")
         self.clear_search_highlights()
@@ -1733,6 +2532,12 @@ class AndroidPackageManager(QMainWindow):
 
     def __init__(self):
         super().__init__()
+        # 패키지 목록을 미리 읽고 있는 디바이스
+        self._warming_devices = set()
+        # adb devices 를 실행 중인지 여부
+        self._loading_devices = False
+        # 마지막으로 표시한 디바이스 목록 (같으면 목록을 다시 채우지 않음)
+        self._last_devices_sig = None
         self.init_ui()
         self.load_devices()
 
@@ -1783,27 +2588,81 @@ class AndroidPackageManager(QMainWindow):
         self.package_widget.setFocusPolicy(Qt.StrongFocus)
 
     def load_devices(self):
-        """연결된 디바이스 목록 로드"""
-        try:
-            result = subprocess.run("adb devices", shell=True, capture_output=True, text=True)
-            devices = []
+        """연결된 디바이스 목록 로드 (adb 는 공용 스레드 풀에서 실행해 창이 멈추지 않음)"""
+        # 이미 읽는 중이면 그 결과를 사용
+        if self._loading_devices:
+            return
+        self._loading_devices = True
+        self.statusBar().showMessage("디바이스 검색 중...")
+
+        def run():
+            try:
+                devices = list_online_devices()
+            except Exception as e:
+                QMetaObject.invokeMethod(self, "on_device_list_error",
+                                         Qt.QueuedConnection,
+                                         Q_ARG(str, str(e)))
+                return
+            QMetaObject.invokeMethod(self, "on_devices_loaded",
+                                     Qt.QueuedConnection,
+                                     Q_ARG(list, list(devices)))
 
-            for line in result.stdout.split('\n')[1:]:
-                if line.strip() and '\tdevice' in line:
-                    device_id = line.split('\t')[0]
-                    devices.append(device_id)
+        _ADB_POOL.start(AdbTask(run))
 
-            # 디바이스 목록 정렬
-            devices.sort()
+    @pyqtSlot(list)
+    def on_devices_loaded(self, devices):
+        """디바이스 목록 표시 (메인 스레드에서 실행)"""
+        self._loading_devices = False
+        self.statusBar().showMessage(f"{len(devices)}개의 디바이스가 연결됨")
+
+        # 목록이 같아도 캐시가 만료된 디바이스는 다시 미리 읽음 (캐시에 있거나 읽는 중이면 건너뜀)
+        for device in devices:
+            self.warm_package_cache(device)
+
+        # 목록이 바뀌지 않았으면 선택 상태를 유지한 채 그대로 둠
+        devices_sig = tuple(devices)
+        if devices_sig == self._last_devices_sig:
+            return
+        self._last_devices_sig = devices_sig
 
-            self.device_list.clear()
-            for device in devices:
-                self.device_list.addItem(device)
+        self.device_list.clear()
+        self.device_list.addItems(devices)
 
-            self.statusBar().showMessage(f"{len(devices)}개의 디바이스가 연결됨")
+    @pyqtSlot(str)
+    def on_device_list_error(self, error_message):
+        """디바이스 목록 오류 처리 (메인 스레드에서 실행)"""
+        self._loading_devices = False
+        QMessageBox.critical(self, "오류", f"디바이스 목록을 가져올 수 없습니다: {error_message}")
+
+    def shutdown(self):
+        """종료 전 adb 세션을 닫고 실행 중인 워커 스레드가 끝날 때까지 대기"""
+        operation_worker = self.package_widget.operation_worker
+        if operation_worker is not None:
+            operation_worker.cancel()
+
+        # 세션을 닫으면 출력을 기다리던 워커들이 오류로 바로 끝남
+        AdbShell.close_all()
+
+        workers = self.findChildren(QThread)
+        if operation_worker is not None:
+            workers.append(operation_worker)
+        for worker in workers:
+            worker.wait()
+        # 아직 시작하지 않은 풀 작업(미리 받기, 묶음 활성화)은 실행하지 않고 버림
+        _ADB_POOL.clear()
+        _ADB_POOL.waitForDone()
+
+    def warm_package_cache(self, device_id):
+        """디바이스를 선택하기 전에 패키지 목록을 백그라운드에서 읽어 캐시에 넣어 둠"""
+        if device_id in self._warming_devices or _PACKAGE_LIST_CACHE.get(device_id) is not None:
+            return
+        self._warming_devices.add(device_id)
 
-        except Exception as e:
-            QMessageBox.critical(self, "오류", f"디바이스 목록을 가져올 수 없습니다: {str(e)}")
+        # 결과는 PackageWorker 가 캐시에 저장하므로 시그널은 연결하지 않음 (오류도 무시)
+        worker = PackageWorker(device_id, self)
+        worker.finished.connect(lambda: self._warming_devices.discard(device_id))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
 
     def on_device_selected(self, item):
         """디바이스 선택 시 패키지 목록 로드"""
@@ -1832,16 +2691,17 @@ class AndroidPackageManager(QMainWindow):
 def main():
     app = QApplication(sys.argv)
 
-    # ADB가 설치되어 있는지 확인
-    try:
-        subprocess.run("adb version", shell=True, capture_output=True, check=True)
-    except subprocess.CalledProcessError:
+    # ADB가 설치되어 있는지 확인 (adb 프로세스를 띄우지 않고 PATH 에서만 찾음)
+    if shutil.which("adb") is None:
         QMessageBox.critical(None, "오류", "ADB가 설치되어 있지 않거나 PATH에 등록되어 있지 않습니다.")
         sys.exit(1)
 
     window = AndroidPackageManager()
     window.show()
 
+    # 종료 시 영구 adb shell 세션 정리 (QThread 가 실행 중인 채로 삭제되지 않도록 워커 종료도 대기)
+    app.aboutToQuit.connect(window.shutdown)
+
     sys.exit(app.exec_())
 
 